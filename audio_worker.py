@@ -0,0 +1,182 @@
+"""
+Background audio worker for the music generator.
+Runs note generation, synthesis and mixing on a separate thread fed with
+snapshots of the board through a bounded queue, so busy generations never
+stall the render loop.
+"""
+
+import threading
+import traceback
+import numpy as np
+from collections import deque
+from typing import Dict, Optional, Set, Tuple, Union
+from game_of_life import GameOfLife
+from sparse_world import SparseWorld
+from music_generator import MusicGenerator
+
+
+class GameSnapshot:
+    """Copy of the board state MusicGenerator reads, taken on the simulation thread."""
+
+    def __init__(self, game: GameOfLife, include_neighbors: bool = False):
+        """
+        Copy the state of a game.
+
+        Args:
+            game: Game to copy
+            include_neighbors: Also copy the game's neighbor counts (needed by pattern mode
+                               for worlds whose edges don't wrap; otherwise they are
+                               counted from the copied grid when first asked for)
+        """
+        self.width = game.width
+        self.height = game.height
+        self.generation = game.generation
+        self.grid = game.grid.copy()
+        self.births = game.get_births().copy()
+        self.density = game.get_cell_density()
+        self.population_change = game.get_population_change()
+        self.neighbors = game.count_all_neighbors() if include_neighbors else None
+
+    def merge_older(self, older: 'GameSnapshot') -> None:
+        """Fold an older, unprocessed snapshot into this one so its births still play."""
+        self.births |= older.births
+
+    def get_births(self) -> np.ndarray:
+        """Get the mask of cells born in the last generation."""
+        return self.births
+
+    def get_cell_density(self) -> float:
+        """Get the density of living cells (0.0 to 1.0)."""
+        return self.density
+
+    def get_population_change(self) -> int:
+        """Get the change in population from last generation."""
+        return self.population_change
+
+    def count_all_neighbors(self) -> np.ndarray:
+        """Count living neighbors of every cell, with wrapping edges unless copied from the game."""
+        if self.neighbors is None:
+            self.neighbors = GameOfLife.count_all_neighbors(self)
+        return self.neighbors
+
+
+class AudioWorker:
+    """Thread that generates, synthesizes and mixes music from queued board snapshots."""
+
+    POLICIES = ('merge', 'drop_oldest', 'drop_newest')
+
+    def __init__(self, music_gen: MusicGenerator, max_pending: int = 2, policy: str = 'merge'):
+        """
+        Start the worker thread. From now on the worker owns the generator's audio:
+        only submit() boards and change settings from other threads. The worker plays
+        snapshots of the boards and never touches music_gen.game.
+
+        Args:
+            music_gen: Music generator to run on the worker thread
+            max_pending: Snapshots that may wait in the queue
+            policy: What to do with a new snapshot when the queue is full:
+                    'merge' folds it into the newest waiting one (keeping both births),
+                    'drop_oldest' discards the oldest waiting one, 'drop_newest' discards it
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected one of {self.POLICIES}")
+
+        self.music_gen = music_gen
+        self.max_pending = max_pending
+        self.policy = policy
+
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.merged = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        self._reported_errors: Set[Tuple[type, str]] = set()
+
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._running = True
+
+        # Wake up often enough to keep the mixer's output channel fed
+        self._poll_interval = music_gen.mixer.block_frames / music_gen.sample_rate / 4
+
+        self._thread = threading.Thread(target=self._run, name='audio-worker', daemon=True)
+        self._thread.start()
+
+    def submit(self, game: Union[GameOfLife, GameSnapshot]) -> None:
+        """Queue the current state of a game for music generation."""
+        # Neighbor counts are only copied when the snapshot can't recount them from its grid
+        snapshot = game if isinstance(game, GameSnapshot) else \
+            GameSnapshot(game, include_neighbors=self.music_gen.current_mode == 'pattern'
+                         and isinstance(game, SparseWorld))
+
+        with self._condition:
+            self.submitted += 1
+            if len(self._pending) >= self.max_pending:
+                if self.policy == 'drop_newest':
+                    self.dropped += 1
+                    return
+                if self.policy == 'drop_oldest':
+                    self._pending.popleft()
+                    self.dropped += 1
+                else:
+                    snapshot.merge_older(self._pending.pop())
+                    self.merged += 1
+
+            self._pending.append(snapshot)
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """Generate music for queued snapshots and keep the audio stream fed."""
+        while True:
+            with self._condition:
+                if self._running and not self._pending:
+                    self._condition.wait(self._poll_interval)
+                if not self._running:
+                    break
+                snapshot = self._pending.popleft() if self._pending else None
+
+            # A failing generation is skipped so the stream keeps being fed; see _report_error
+            try:
+                if snapshot is not None:
+                    self.music_gen.generate_music(snapshot)
+                    self.processed += 1
+                else:
+                    self.music_gen.update_audio()
+            except Exception as error:
+                self._report_error(error)
+
+    def _report_error(self, error: Exception) -> None:
+        """
+        Count an error and keep it as last_error for the UI. Its traceback is only printed
+        the first time an error of that type and message occurs, so a failure repeating
+        every generation doesn't flood stderr.
+        """
+        self.errors += 1
+        self.last_error = error
+        key = (type(error), str(error))
+        if key not in self._reported_errors:
+            self._reported_errors.add(key)
+            traceback.print_exception(type(error), error, error.__traceback__)
+
+    def get_pending_count(self) -> int:
+        """Get the number of snapshots waiting to be processed."""
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get queue and error counters."""
+        return {
+            'submitted': self.submitted,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'merged': self.merged,
+            'errors': self.errors,
+            'pending': self.get_pending_count()
+        }
+
+    def stop(self) -> None:
+        """Stop the worker thread and hand the generator back to the calling thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
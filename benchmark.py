@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for Musical Conway's Game of Life.
+Run without arguments to see the available benchmarks.
+"""
+
+import argparse
+import os
+import sys
+import time
+import numpy as np
+
+# Add current directory to path for imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from game_of_life import GameOfLife
+
+
+def benchmark_parallel_scaling(sizes, max_workers: int, generations: int) -> None:
+    """Report generations/sec of the 'parallel' engine from 1 to max_workers processes."""
+    print("Parallel engine scaling (generations/sec)")
+    print("=========================================")
+
+    rng = np.random.default_rng(0)
+    header = f"{'size':>12} {'numpy':>10}" + "".join(f" {f'{n} proc':>10}" for n in range(1, max_workers + 1))
+    print(header)
+
+    for size in sizes:
+        initial = rng.random((size, size)) < 0.3
+        results = []
+
+        for engine, workers in [('numpy', None)] + [('parallel', n) for n in range(1, max_workers + 1)]:
+            game = GameOfLife(size, size, engine=engine, workers=workers)
+            game.grid = initial.copy()
+            game.next_generation()  # Warm up (starts the worker pool)
+
+            start = time.perf_counter()
+            for _ in range(generations):
+                game.next_generation()
+            elapsed = time.perf_counter() - start
+
+            game.shutdown_workers()
+            results.append(generations / elapsed)
+
+        print(f"{f'{size}x{size}':>12}" + "".join(f" {rate:>10.1f}" for rate in results))
+
+
+def benchmark_tone_synthesis(durations, sustains, notes: int) -> None:
+    """Report the time to synthesize one note for each note duration and sustain."""
+    from music_generator import MusicGenerator
+
+    # No sound is played, so don't require an audio device
+    generator = MusicGenerator(GameOfLife(10, 10), headless=True)
+    title = f"Tone synthesis at {generator.sample_rate} Hz (ms/note)"
+    print(title)
+    print("=" * len(title))
+    print(f"{'duration':>10}" + "".join(f" {f'sus {s:g}s':>10}" for s in sustains))
+
+    for duration in durations:
+        results = []
+        for sustain in sustains:
+            generator.sustain_duration = sustain
+            generator._synthesize_tone(440.0, duration, 0.3)  # Warm up (allocates buffers)
+
+            start = time.perf_counter()
+            for _ in range(notes):
+                generator._synthesize_tone(440.0, duration, 0.3)
+            results.append((time.perf_counter() - start) / notes * 1000)
+
+        print(f"{f'{duration:g}s':>10}" + "".join(f" {ms:>10.3f}" for ms in results))
+
+    generator.cleanup()
+
+
+def main():
+    """Parse arguments and run the selected benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='benchmark')
+
+    scaling = subparsers.add_parser('scaling', help="Parallel engine scaling across worker counts")
+    scaling.add_argument('--sizes', type=int, nargs='+', default=[512, 1024, 2048, 4096],
+                         help="Square grid sizes to test")
+    scaling.add_argument('--workers', type=int, default=os.cpu_count(),
+                         help="Maximum number of worker processes")
+    scaling.add_argument('--generations', type=int, default=20,
+                         help="Generations to time per configuration")
+
+    synth = subparsers.add_parser('synth', help="Per-note tone synthesis time")
+    synth.add_argument('--durations', type=float, nargs='+', default=[0.1, 0.3, 0.5, 1.0],
+                       help="Note durations in seconds")
+    synth.add_argument('--sustains', type=float, nargs='+', default=[0.0, 0.2, 1.0, 3.0],
+                       help="Sustain durations in seconds")
+    synth.add_argument('--notes', type=int, default=200,
+                       help="Notes to time per configuration")
+
+    args = parser.parse_args()
+    if args.benchmark == 'scaling':
+        benchmark_parallel_scaling(args.sizes, args.workers, args.generations)
+    elif args.benchmark == 'synth':
+        benchmark_tone_synthesis(args.durations, args.sustains, args.notes)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Bit-packed Game of Life backend for very large worlds.
+Stores each row as uint64 words (one bit per cell) and steps 64 cells per
+operation using bit-parallel adder logic, with the same toroidal wrapping
+and cell API as GameOfLife.
+"""
+
+import numpy as np
+from typing import List, Tuple, Union
+from game_of_life import GameOfLife, RuleSet
+
+
+WORD_BITS = 64
+ONE = np.uint64(1)
+HIGH_BIT = np.uint64(WORD_BITS - 1)
+WORD_DTYPE = np.dtype('<u8')
+
+# Number of set bits in every byte value, used to count population
+_BYTE_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+class BitboardGameOfLife(GameOfLife):
+    """Game of Life whose grid is packed into uint64 words, one bit per cell."""
+
+    def __init__(self, width: int = 50, height: int = 50, rule_set: Union[RuleSet, str] = RuleSet.CONWAY):
+        """
+        Initialize the bit-packed grid.
+
+        Args:
+            width: Grid width in cells
+            height: Grid height in cells
+            rule_set: Preset rule set or any Life-like rulestring (e.g. "B36/S23")
+        """
+        self.words_per_row = (width + WORD_BITS - 1) // WORD_BITS
+        self.words = np.zeros((height, self.words_per_row), dtype=WORD_DTYPE)
+
+        # Bit position of the last column inside the last word of each row,
+        # and a mask clearing the unused padding bits above it
+        self.last_bit = np.uint64((width - 1) % WORD_BITS)
+        self.last_word_mask = np.uint64((1 << (int(self.last_bit) + 1)) - 1)
+
+        super().__init__(width, height, rule_set)
+
+        # Births and deaths of the last step, kept packed
+        self._birth_words = np.zeros_like(self.words)
+        self._death_words = np.zeros_like(self.words)
+        self._births = self._deaths = None
+
+        self.engines = {
+            'bitboard': self._next_words_bitboard
+        }
+        self.engine = 'bitboard'
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Unpacked boolean copy of the grid (modifying it does not change the board)."""
+        return self._unpack(self.words)
+
+    @grid.setter
+    def grid(self, value: np.ndarray) -> None:
+        """Pack a boolean grid into words, forgetting any detected cycle."""
+        padded = np.zeros((self.height, self.words_per_row * WORD_BITS), dtype=bool)
+        padded[:, :self.width] = value
+        packed = np.packbits(padded, axis=1, bitorder='little')
+        self.words = packed.view(WORD_DTYPE).copy()
+        self.reset_cycle_detection()
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set the state of a cell at position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            bit = ONE << np.uint64(x % WORD_BITS)
+            if alive:
+                self.words[y, x // WORD_BITS] |= bit
+            else:
+                self.words[y, x // WORD_BITS] &= ~bit
+            self._cell_edited(x, y)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get the state of a cell at position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool((int(self.words[y, x // WORD_BITS]) >> (x % WORD_BITS)) & 1)
+        return False
+
+    def toggle_cell(self, x: int, y: int) -> None:
+        """Toggle the state of a cell at position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.words[y, x // WORD_BITS] ^= ONE << np.uint64(x % WORD_BITS)
+            self._cell_edited(x, y)
+
+    def count_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors around cell at (x, y) with wrapping edges."""
+        count = 0
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if dx == 0 and dy == 0:
+                    continue
+                if self.get_cell((x + dx) % self.width, (y + dy) % self.height):
+                    count += 1
+        return count
+
+    def clear_grid(self) -> None:
+        """Clear all cells from the grid."""
+        self.words.fill(0)
+        self._birth_words.fill(0)
+        self._death_words.fill(0)
+        self.reset_cycle_detection()
+        self.generation = 0
+        self.population_history = []
+
+    def _unpack(self, words: np.ndarray) -> np.ndarray:
+        """Unpack words into a boolean array of grid size."""
+        bits = np.unpackbits(words.view(np.uint8), axis=1, bitorder='little')
+        return bits[:, :self.width].astype(bool)
+
+    def get_living_coords(self) -> np.ndarray:
+        """Get the (x, y) coordinates of all living cells as an array of shape (population, 2)."""
+        ys, xs = np.nonzero(self.grid)
+        return np.column_stack((xs, ys))
+
+    def get_living_cells(self) -> List[Tuple[int, int]]:
+        """Get list of coordinates of all living cells."""
+        ys, xs = np.nonzero(self.grid)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def get_births(self) -> np.ndarray:
+        """Get the mask of cells born in the last generation (unpacked on demand)."""
+        return self._unpack(self._birth_words)
+
+    def get_deaths(self) -> np.ndarray:
+        """Get the mask of cells that died in the last generation (unpacked on demand)."""
+        return self._unpack(self._death_words)
+
+    def get_population(self) -> int:
+        """Get the number of living cells."""
+        return int(_BYTE_POPCOUNT[self.words.view(np.uint8)].sum(dtype=np.int64))
+
+    def get_memory_usage(self) -> int:
+        """Get the number of bytes used to store the grid."""
+        return self.words.nbytes
+
+    def _shift_from_west(self, rows: np.ndarray) -> np.ndarray:
+        """Move every cell one column east, so each bit holds its west neighbor."""
+        shifted = rows << ONE
+        shifted[:, 1:] |= rows[:, :-1] >> HIGH_BIT
+        shifted[:, 0] |= (rows[:, -1] >> self.last_bit) & ONE
+        shifted[:, -1] &= self.last_word_mask
+        return shifted
+
+    def _shift_from_east(self, rows: np.ndarray) -> np.ndarray:
+        """Move every cell one column west, so each bit holds its east neighbor."""
+        shifted = rows >> ONE
+        shifted[:, :-1] |= rows[:, 1:] << HIGH_BIT
+        shifted[:, -1] |= (rows[:, 0] & ONE) << self.last_bit
+        return shifted
+
+    def _next_words_bitboard(self) -> np.ndarray:
+        """Compute the next generation 64 cells at a time with bit-sliced counters."""
+        alive = self.words
+        west = self._shift_from_west(alive)
+        east = self._shift_from_east(alive)
+
+        neighbors = [west, east]
+        for rows in (west, alive, east):
+            neighbors.append(np.roll(rows, 1, axis=0))
+            neighbors.append(np.roll(rows, -1, axis=0))
+
+        # Ripple-carry add the eight neighbor boards into a 4-bit count per cell
+        count_bits = [np.zeros_like(alive) for _ in range(4)]
+        for board in neighbors:
+            carry = board
+            for i in range(3):
+                next_carry = count_bits[i] & carry
+                count_bits[i] ^= carry
+                carry = next_carry
+            count_bits[3] |= carry
+
+        dead = ~alive
+        new_words = np.zeros_like(alive)
+        for count in range(9):
+            births, survives = self.rule_table[0, count], self.rule_table[1, count]
+            if not (births or survives):
+                continue
+
+            matches = np.full_like(alive, ~np.uint64(0))
+            for i in range(4):
+                matches &= count_bits[i] if (count >> i) & 1 else ~count_bits[i]
+
+            if births and survives:
+                new_words |= matches
+            elif births:
+                new_words |= matches & dead
+            else:
+                new_words |= matches & alive
+
+        new_words[:, -1] &= self.last_word_mask
+        return new_words
+
+    def _snapshot(self) -> np.ndarray:
+        """Get a copy of the packed words for cycle detection."""
+        return self.words.copy()
+
+    def _restore(self, snapshot: np.ndarray) -> None:
+        """Make a copy of stored packed words the current board state."""
+        self.words = snapshot.copy()
+
+    def _current_state(self) -> np.ndarray:
+        """Get the current packed words, which stepping replaces rather than modifies."""
+        return self.words
+
+    def _update_change_indexes(self, previous: np.ndarray) -> None:
+        """Derive packed births and deaths from the last step."""
+        self._birth_words = self.words & ~previous
+        self._death_words = previous & ~self.words
+
+    def _advance(self) -> None:
+        """Replace the packed words with the next generation."""
+        self.words = self.engines[self.engine]()
@@ -6,7 +6,6 @@ Shows how to use the system programmatically without the GUI.
 
 import sys
 import os
-import time
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -58,7 +57,7 @@ def demo_patterns():
             game.next_generation()
             
             # Small delay to hear the music
-            time.sleep(0.5)
+            music_gen.wait(0.5)
         
         print(f"Final population: {len(game.get_living_cells())}")
         print("Press Enter to continue to next pattern...")
@@ -93,7 +92,7 @@ def demo_musical_modes():
             print(f"Gen {game.generation}: {len(game.get_living_cells())} cells")
             music_gen.generate_music()
             game.next_generation()
-            time.sleep(0.3)
+            music_gen.wait(0.3)
         
         print("Press Enter for next mode...")
         input()
@@ -0,0 +1,145 @@
+"""
+Batched simulation of many Game of Life boards at once.
+All boards share one 3-D array and are stepped in a single vectorized call,
+each with its own rule set - useful for parameter sweeps over rule sets
+and patterns.
+"""
+
+import numpy as np
+from typing import Dict, List, Sequence, Tuple, Union
+from game_of_life import RuleSet, RULE_PRESETS, compile_rule
+
+
+class LifeEnsemble:
+    """N equally sized toroidal boards stepped together, each with its own rules."""
+
+    def __init__(self, count: int, width: int = 50, height: int = 50,
+                 rule_sets: Union[RuleSet, str, Sequence[Union[RuleSet, str]]] = RuleSet.CONWAY):
+        """
+        Initialize the ensemble with empty boards.
+
+        Args:
+            count: Number of boards
+            width: Board width in cells
+            height: Board height in cells
+            rule_sets: One rule set for every board, or a sequence with one per board
+                       (presets or Life-like rulestrings)
+        """
+        self.count = count
+        self.width = width
+        self.height = height
+        self.grids = np.zeros((count, height, width), dtype=bool)
+        self.generation = 0
+
+        if isinstance(rule_sets, (RuleSet, str)):
+            rule_sets = [rule_sets] * count
+        if len(rule_sets) != count:
+            raise ValueError(f"Expected {count} rule sets, got {len(rule_sets)}")
+
+        self.rule_sets = list(rule_sets)
+        self.rule_tables = np.stack([self._compile(rule_set) for rule_set in self.rule_sets])
+
+        # Offset of each board's (2, 9) table inside the flattened rule tables
+        self._table_offsets = (np.arange(count) * 18)[:, None, None]
+
+    @classmethod
+    def from_sweep(cls, rule_sets: Sequence[Union[RuleSet, str]], patterns: Dict[str, List[List[int]]],
+                   width: int = 50, height: int = 50) -> Tuple['LifeEnsemble', List[Tuple[Union[RuleSet, str], str]]]:
+        """
+        Build one board per (rule set, pattern) combination, with the pattern centered.
+
+        Args:
+            rule_sets: Rule sets to sweep over
+            patterns: Pattern dictionary such as GameOfLife.get_patterns()
+            width: Board width in cells
+            height: Board height in cells
+
+        Returns:
+            Tuple of (ensemble, list of (rule_set, pattern_name) labels per board)
+        """
+        labels = [(rule_set, name) for rule_set in rule_sets for name in patterns]
+        ensemble = cls(len(labels), width, height, [rule_set for rule_set, _ in labels])
+
+        for index, (_, name) in enumerate(labels):
+            pattern = patterns[name]
+            x = (width - len(pattern[0])) // 2
+            y = (height - len(pattern)) // 2
+            ensemble.add_pattern(index, pattern, x, y)
+
+        return ensemble, labels
+
+    def _compile(self, rule_set: Union[RuleSet, str]) -> np.ndarray:
+        """Get the transition table for a preset or rulestring."""
+        rulestring = RULE_PRESETS[rule_set] if isinstance(rule_set, RuleSet) else rule_set
+        return compile_rule(rulestring)[3]
+
+    def set_rule_set(self, index: int, rule_set: Union[RuleSet, str]) -> None:
+        """Change the rule set of one board."""
+        self.rule_sets[index] = rule_set
+        self.rule_tables[index] = self._compile(rule_set)
+
+    def set_cell(self, index: int, x: int, y: int, alive: bool) -> None:
+        """Set the state of a cell at position (x, y) on one board."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.grids[index, y, x] = alive
+
+    def add_pattern(self, index: int, pattern: List[List[int]], x: int, y: int) -> None:
+        """
+        Add a predefined pattern to one board at position (x, y).
+
+        Args:
+            index: Board index
+            pattern: 2D list where 1 represents living cell, 0 represents dead cell
+            x: X coordinate of top-left corner
+            y: Y coordinate of top-left corner
+        """
+        for py, row in enumerate(pattern):
+            for px, cell in enumerate(row):
+                if cell == 1:
+                    self.set_cell(index, x + px, y + py, True)
+
+    def clear(self) -> None:
+        """Clear every board."""
+        self.grids.fill(False)
+        self.generation = 0
+
+    def get_populations(self) -> np.ndarray:
+        """Get the number of living cells on each board."""
+        return self.grids.sum(axis=(1, 2))
+
+    def step(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advance every board by one generation in a single vectorized call.
+
+        Returns:
+            Tuple of (population, births, deaths) arrays with one entry per board
+        """
+        cells = self.grids.astype(np.uint8)
+        columns = cells + np.roll(cells, 1, axis=1) + np.roll(cells, -1, axis=1)
+        neighbors = columns + np.roll(columns, 1, axis=2) + np.roll(columns, -1, axis=2) - cells
+
+        # Index every board's own table in one flat lookup
+        index = self._table_offsets + cells.astype(np.intp) * 9 + neighbors
+        new_grids = self.rule_tables.reshape(-1)[index]
+
+        births = (new_grids & ~self.grids).sum(axis=(1, 2))
+        deaths = (self.grids & ~new_grids).sum(axis=(1, 2))
+
+        self.grids = new_grids
+        self.generation += 1
+        return new_grids.sum(axis=(1, 2)), births, deaths
+
+    def run(self, generations: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Advance every board by several generations.
+
+        Returns:
+            Tuple of (population, births, deaths) arrays of shape (generations, count)
+        """
+        if generations < 0:
+            raise ValueError(f"Generations must be non-negative, got {generations}")
+
+        population, births, deaths = (np.zeros((generations, self.count), dtype=np.intp) for _ in range(3))
+        for generation in range(generations):
+            population[generation], births[generation], deaths[generation] = self.step()
+        return population, births, deaths
@@ -3,9 +3,15 @@ Conway's Game of Life implementation with musical integration support.
 Supports multiple rule sets for creating different types of patterns.
 """
 
+import re
+import hashlib
 import numpy as np
-from typing import Tuple, List, Optional, Dict, Set
+from collections import deque
+from functools import lru_cache
+from typing import Tuple, List, Optional, Dict, FrozenSet, Union
 from enum import Enum
+from hashlife import HashLife
+from parallel_life import ParallelStepper
 
 
 class RuleSet(Enum):
@@ -20,59 +26,198 @@ class RuleSet(Enum):
     LIFE_WITHOUT_DEATH = "life_without_death"  # B3/S012345678 - Life without Death
 
 
+# Rulestrings behind each preset rule set
+RULE_PRESETS = {
+    RuleSet.CONWAY: "B3/S23",
+    RuleSet.HIGHLIFE: "B36/S23",
+    RuleSet.DAY_NIGHT: "B3678/S34678",
+    RuleSet.MAZE: "B3/S12345",
+    RuleSet.CORAL: "B3/S45678",
+    RuleSet.SEEDS: "B2/S",
+    RuleSet.DIAMOEBA: "B35678/S5678",
+    RuleSet.LIFE_WITHOUT_DEATH: "B3/S012345678"
+}
+
+_BS_RULE = re.compile(r'^B([0-8]*)/S([0-8]*)$')
+_SB_RULE = re.compile(r'^S([0-8]*)/B([0-8]*)$')
+_LEGACY_RULE = re.compile(r'^([0-8]*)/([0-8]*)$')
+
+
+@lru_cache(maxsize=None)
+def compile_rule(rulestring: str) -> Tuple[str, FrozenSet[int], FrozenSet[int], np.ndarray]:
+    """
+    Parse and compile a Life-like rulestring into a transition table.
+    
+    Accepts B/S notation ("B36/S23"), S/B notation ("S23/B36") and the legacy
+    survival/birth form ("23/36"). Results are cached per rulestring.
+    
+    Args:
+        rulestring: Rule in any of the accepted notations (case-insensitive)
+        
+    Returns:
+        Tuple of (canonical B/S rulestring, birth_conditions, survival_conditions,
+        read-only boolean table of shape (2, 9) indexed by [current_state, neighbor_count])
+    """
+    text = rulestring.strip().upper().replace(' ', '')
+    match = _BS_RULE.match(text)
+    if match:
+        birth_digits, survival_digits = match.groups()
+    elif _SB_RULE.match(text):
+        survival_digits, birth_digits = _SB_RULE.match(text).groups()
+    elif _LEGACY_RULE.match(text):
+        survival_digits, birth_digits = _LEGACY_RULE.match(text).groups()
+    else:
+        raise ValueError(f"Invalid rulestring: {rulestring}")
+
+    birth = frozenset(int(digit) for digit in birth_digits)
+    survival = frozenset(int(digit) for digit in survival_digits)
+
+    table = np.zeros((2, 9), dtype=bool)
+    table[0, sorted(birth)] = True
+    table[1, sorted(survival)] = True
+    table.flags.writeable = False
+
+    canonical = "B" + "".join(map(str, sorted(birth))) + "/S" + "".join(map(str, sorted(survival)))
+    return canonical, birth, survival, table
+
+
+# Canonical rulestrings mapped back to their presets
+_PRESETS_BY_RULESTRING = {compile_rule(rulestring)[0]: rule_set for rule_set, rulestring in RULE_PRESETS.items()}
+
+
 class GameOfLife:
     """Cellular automaton with multiple rule sets for creating different patterns."""
     
-    def __init__(self, width: int = 50, height: int = 50, rule_set: RuleSet = RuleSet.CONWAY):
+    def __init__(self, width: int = 50, height: int = 50, rule_set: Union[RuleSet, str] = RuleSet.CONWAY,
+                 engine: str = 'numpy', tile_size: int = 16, workers: Optional[int] = None,
+                 cycle_window: int = 64, cycle_max_bytes: int = 32 * 1024 * 1024):
         """
         Initialize the Game of Life grid.
         
         Args:
             width: Grid width in cells
             height: Grid height in cells
-            rule_set: Rule set to use for cellular automaton
+            rule_set: Preset rule set or any Life-like rulestring (e.g. "B36/S23")
+            engine: Stepping backend ('numpy' for whole-array stepping,
+                    'tiled' to recompute only tiles near last generation's changes,
+                    'parallel' to step horizontal bands in worker processes,
+                    'reference' for the original per-cell loop)
+            tile_size: Edge length in cells of the tiles tracked by the 'tiled' engine
+            workers: Number of processes used by the 'parallel' engine (defaults to the CPU count)
+            cycle_window: Number of recent generations whose state hashes are kept for cycle detection (0 disables it)
+            cycle_max_bytes: Memory allowed for the states of a detected cycle; longer cycles are
+                             not replayed, and boards whose state alone is larger skip detection
         """
         self.width = width
         self.height = height
+
+        # Cycle detection - hashes of recent states; when a hash repeats, the
+        # states of one candidate period are stored and confirmed before replay
+        self.cycle_window = cycle_window
+        self.cycle_max_bytes = cycle_max_bytes
+        self._state_hashes = deque(maxlen=cycle_window)
+        self._candidate_period = None
+        self._cycle_states = []
+        self.cycle_start = None
+        self.cycle_period = None
+        self._replay_state = None  # Board state installed by the last replayed step
+
         self.grid = np.zeros((height, width), dtype=bool)
         self.generation = 0
         self.population_history = []
-        self.rule_set = rule_set
-        self.birth_rules, self.survival_rules = self._parse_rules(rule_set)
+        self._apply_rule_set(rule_set)
+
+        # Per-generation indexes produced while stepping - births/deaths masks
+        # of the last step, plus population and living cells cached until the grid changes
+        self._births = np.zeros((height, width), dtype=bool)
+        self._deaths = np.zeros((height, width), dtype=bool)
+
+        # Tile layout for active-region tracking - edge tiles wrap around the
+        # board, so each tile's row/column indices (with a one-cell halo) are
+        # precomputed modulo the grid size
+        self.tile_size = tile_size
+        self.tiles_y = (height + tile_size - 1) // tile_size
+        self.tiles_x = (width + tile_size - 1) // tile_size
+        halo = np.arange(-1, tile_size + 1)
+        self._tile_rows = (np.arange(self.tiles_y)[:, None] * tile_size + halo) % height
+        self._tile_cols = (np.arange(self.tiles_x)[:, None] * tile_size + halo) % width
+        self.active_tiles = np.ones((self.tiles_y, self.tiles_x), dtype=bool)
+        self._tiled_grid = None
+
+        # HashLife universe used by fast_forward, created on first use
+        self._hashlife = None
+
+        # Worker pool used by the 'parallel' engine, started on first use
+        self.workers = workers
+        self._parallel = None
+
+        # Stepping backends - each returns the next grid without modifying the current one
+        self.engines = {
+            'numpy': self._next_grid_numpy,
+            'tiled': self._next_grid_tiled,
+            'parallel': self._next_grid_parallel,
+            'reference': self._next_grid_reference
+        }
+        if engine not in self.engines:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
     
-    def _parse_rules(self, rule_set: RuleSet) -> Tuple[Set[int], Set[int]]:
+    @property
+    def grid(self) -> np.ndarray:
+        """Boolean array of cell states indexed as [y, x]."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, value: np.ndarray) -> None:
+        """Replace the grid, invalidating the cached population and living cells and any detected cycle."""
+        self._set_grid(value)
+        self.reset_cycle_detection()
+
+    def _set_grid(self, value: np.ndarray) -> None:
+        """Install a grid produced by stepping, invalidating the cached population and living cells."""
+        self._grid = value
+        self._population = None
+        self._living_coords = None
+        self._living_cells = None
+
+    def _apply_rule_set(self, rule_set: Union[RuleSet, str]) -> None:
         """
-        Parse rule set into birth and survival conditions.
+        Compile a preset or rulestring and install its conditions and transition table.
         
         Args:
-            rule_set: The rule set to parse
-            
-        Returns:
-            Tuple of (birth_conditions, survival_conditions)
+            rule_set: Preset rule set or Life-like rulestring
         """
-        rule_definitions = {
-            RuleSet.CONWAY: ("B3/S23", {3}, {2, 3}),
-            RuleSet.HIGHLIFE: ("B36/S23", {3, 6}, {2, 3}),
-            RuleSet.DAY_NIGHT: ("B3678/S34678", {3, 6, 7, 8}, {3, 4, 6, 7, 8}),
-            RuleSet.MAZE: ("B3/S12345", {3}, {1, 2, 3, 4, 5}),
-            RuleSet.CORAL: ("B3/S45678", {3}, {4, 5, 6, 7, 8}),
-            RuleSet.SEEDS: ("B2/S", {2}, set()),
-            RuleSet.DIAMOEBA: ("B35678/S5678", {3, 5, 6, 7, 8}, {5, 6, 7, 8}),
-            RuleSet.LIFE_WITHOUT_DEATH: ("B3/S012345678", {3}, {0, 1, 2, 3, 4, 5, 6, 7, 8})
-        }
-        
-        _, birth, survival = rule_definitions[rule_set]
-        return birth, survival
+        rulestring = RULE_PRESETS[rule_set] if isinstance(rule_set, RuleSet) else rule_set
+        self.rulestring, self.birth_rules, self.survival_rules, self.rule_table = compile_rule(rulestring)
+
+        # Rulestrings matching a preset are reported as that preset
+        self.rule_set = _PRESETS_BY_RULESTRING.get(self.rulestring, self.rulestring)
     
-    def set_rule_set(self, rule_set: RuleSet) -> None:
-        """Change the rule set for the cellular automaton."""
-        self.rule_set = rule_set
-        self.birth_rules, self.survival_rules = self._parse_rules(rule_set)
+    def set_rule_set(self, rule_set: Union[RuleSet, str]) -> None:
+        """Change the rule set for the cellular automaton (preset or rulestring)."""
+        self._apply_rule_set(rule_set)
+        self.mark_all_tiles_active()
+        self.reset_cycle_detection()
+
+    def set_engine(self, engine: str) -> None:
+        """Change the stepping backend used by next_generation, stopping workers the new one doesn't use."""
+        if engine in self.engines:
+            if engine != 'parallel':
+                self.shutdown_workers()
+            self.engine = engine
+            self.mark_all_tiles_active()
+
+    def get_available_engines(self) -> List[str]:
+        """Get list of all available stepping backends."""
+        return list(self.engines.keys())
         
     def set_cell(self, x: int, y: int, alive: bool) -> None:
         """Set the state of a cell at position (x, y)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.grid[y, x] = alive
+            if self._grid[y, x] != alive:
+                self._grid[y, x] = alive
+                self._adjust_population(1 if alive else -1)
+            self._cell_edited(x, y)
     
     def get_cell(self, x: int, y: int) -> bool:
         """Get the state of a cell at position (x, y)."""
@@ -83,7 +228,39 @@ class GameOfLife:
     def toggle_cell(self, x: int, y: int) -> None:
         """Toggle the state of a cell at position (x, y)."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.grid[y, x] = not self.grid[y, x]
+            self._grid[y, x] = not self._grid[y, x]
+            self._adjust_population(1 if self._grid[y, x] else -1)
+            self._cell_edited(x, y)
+
+    def _adjust_population(self, delta: int) -> None:
+        """Update the cached population after a single-cell edit."""
+        if self._population is not None:
+            self._population += delta
+        self._living_coords = None
+        self._living_cells = None
+
+    def _cell_edited(self, x: int, y: int) -> None:
+        """Record an edit at (x, y) for the tiled engine and cycle detection."""
+        self.active_tiles[y // self.tile_size, x // self.tile_size] = True
+        self.reset_cycle_detection()
+
+    def mark_all_tiles_active(self) -> None:
+        """
+        Force the tiled engine to recompute every tile on the next generation.
+        Call this after modifying the grid array in place.
+        """
+        self.active_tiles.fill(True)
+
+    def get_active_tile_count(self) -> int:
+        """
+        Get the number of tiles that changed in the last generation.
+        Engines other than 'tiled' don't track activity and report every tile.
+        """
+        return int(np.count_nonzero(self.active_tiles))
+
+    def get_tile_count(self) -> int:
+        """Get the total number of tiles on the board."""
+        return self.tiles_y * self.tiles_x
     
     def count_neighbors(self, x: int, y: int) -> int:
         """Count living neighbors around cell at (x, y) with wrapping edges."""
@@ -99,8 +276,74 @@ class GameOfLife:
                     count += 1
         return count
     
-    def next_generation(self) -> None:
-        """Advance the game by one generation using the current rule set."""
+    def count_all_neighbors(self) -> np.ndarray:
+        """Count living neighbors of every cell at once with wrapping edges."""
+        cells = self.grid.astype(np.uint8)
+
+        # Sum each cell with its vertical neighbors, then add the horizontal
+        # shifts of that column sum and remove the cell itself
+        columns = cells + np.roll(cells, 1, axis=0) + np.roll(cells, -1, axis=0)
+        return columns + np.roll(columns, 1, axis=1) + np.roll(columns, -1, axis=1) - cells
+
+    def _next_grid_numpy(self) -> np.ndarray:
+        """Compute the next generation with whole-array operations."""
+        neighbors = self.count_all_neighbors()
+        return self.rule_table[self.grid.astype(np.uint8), neighbors]
+
+    def _next_grid_tiled(self) -> np.ndarray:
+        """
+        Compute the next generation only for tiles that changed last generation
+        and their neighbors; every other tile is copied forward unchanged.
+        """
+        # A grid assigned from outside can't be trusted to match the tile state
+        if self.grid is not self._tiled_grid:
+            self.mark_all_tiles_active()
+
+        # Changes can spread one cell per generation, so neighbors of active
+        # tiles must be recomputed too
+        near_rows = self.active_tiles | np.roll(self.active_tiles, 1, axis=0) | np.roll(self.active_tiles, -1, axis=0)
+        dirty = near_rows | np.roll(near_rows, 1, axis=1) | np.roll(near_rows, -1, axis=1)
+
+        new_grid = self.grid.copy()
+        self.active_tiles = np.zeros_like(self.active_tiles)
+        tile_ys, tile_xs = np.nonzero(dirty)
+
+        if len(tile_ys):
+            # Gather every dirty tile with its halo into one stack and step them together
+            rows = self._tile_rows[tile_ys][:, :, None]
+            cols = self._tile_cols[tile_xs][:, None, :]
+            cells = self.grid[rows, cols].astype(np.uint8)
+
+            columns = cells[:, :-2, :] + cells[:, 1:-1, :] + cells[:, 2:, :]
+            core = cells[:, 1:-1, 1:-1]
+            neighbors = columns[:, :, :-2] + columns[:, :, 1:-1] + columns[:, :, 2:] - core
+            stepped = self.rule_table[core, neighbors]
+
+            new_grid[rows[:, 1:-1], cols[:, :, 1:-1]] = stepped
+            changed = np.any(stepped != core.astype(bool), axis=(1, 2))
+            self.active_tiles[tile_ys[changed], tile_xs[changed]] = True
+
+        self._tiled_grid = new_grid
+        return new_grid
+
+    def _next_grid_parallel(self) -> np.ndarray:
+        """
+        Compute the next generation in worker processes over shared memory.
+        The returned grid is a shared buffer that the pool reuses two generations later.
+        """
+        if self._parallel is None:
+            self._parallel = ParallelStepper(self.width, self.height, self.workers)
+        return self._parallel.step(self.grid, self.rule_table)
+
+    def shutdown_workers(self) -> None:
+        """Stop the 'parallel' engine's worker processes, keeping the current grid."""
+        if self._parallel is not None:
+            self.grid = self.grid.copy()
+            self._parallel.close()
+            self._parallel = None
+
+    def _next_grid_reference(self) -> np.ndarray:
+        """Compute the next generation one cell at a time (reference backend)."""
         new_grid = np.zeros((self.height, self.width), dtype=bool)
         
         for y in range(self.height):
@@ -117,31 +360,220 @@ class GameOfLife:
                     # Dead cell - check birth rules
                     if neighbors in self.birth_rules:
                         new_grid[y, x] = True
+
+        return new_grid
+    
+    def _advance(self) -> None:
+        """Replace the grid with the next generation from the selected engine."""
+        self._set_grid(self.engines[self.engine]())
+
+    def _current_state(self) -> np.ndarray:
+        """Get the current board state, which stepping replaces rather than modifies."""
+        return self.grid
+
+    def _update_change_indexes(self, previous: np.ndarray) -> None:
+        """
+        Derive births and deaths masks and the population from the last step.
         
-        self.grid = new_grid
-        self.generation += 1
+        Args:
+            previous: Board state from before the step, as returned by _current_state
+        """
+        current = self.grid
+        self._births = current & ~previous
+        self._deaths = previous & ~current
+        self._population = int(np.count_nonzero(current))
+
+    def reset_cycle_detection(self) -> None:
+        """
+        Forget recorded states and stop replaying a detected cycle.
+        Edits to the grid are detected automatically; this forces a fresh start.
+        """
+        if self._state_hashes or self._cycle_states:
+            self._state_hashes.clear()
+            self._candidate_period = None
+            self._cycle_states = []
+            self.cycle_start = None
+            self.cycle_period = None
+            self._replay_state = None
+
+    def _snapshot(self) -> np.ndarray:
+        """Get a copy of the board state for cycle detection."""
+        return self.grid.copy()
+
+    def _restore(self, snapshot: np.ndarray) -> None:
+        """Make a copy of a stored snapshot the current board state."""
+        self._set_grid(snapshot.copy())
+
+    def _record_state(self) -> None:
+        """
+        Hash the current state and look for a repeat among recent generations.
+        States are only copied while a suspected cycle is being confirmed.
+        """
+        state = self._current_state()
+        if state.nbytes > self.cycle_max_bytes:
+            return
+
+        if self._candidate_period is not None:
+            if len(self._cycle_states) < self._candidate_period:
+                self._cycle_states.append(self._snapshot())
+                return
+
+            # A full candidate period has been stored - confirm it really repeats
+            if np.array_equal(self._cycle_states[0], state):
+                # The hash first matched one period before the stored states began
+                self.cycle_period = self._candidate_period
+                self.cycle_start = self.generation - 2 * self.cycle_period
+                self._state_hashes.clear()
+                self._replay_state = self._current_state()
+                return
+            self._candidate_period = None
+            self._cycle_states = []
+
+        # Hash boolean grids bit-packed (8x less data); packed states are hashed as they are
+        data = np.packbits(state) if state.dtype == bool else np.ascontiguousarray(state)
+        state_hash = hashlib.blake2b(data, digest_size=16).digest()
+        for generation, previous_hash in self._state_hashes:
+            if previous_hash == state_hash:
+                period = self.generation - generation
+                if period * state.nbytes <= self.cycle_max_bytes:
+                    self._candidate_period = period
+                    self._cycle_states = [self._snapshot()]
+                    return
+                break
+
+        self._state_hashes.append((self.generation, state_hash))
+
+    def next_generation(self) -> None:
+        """
+        Advance the game by one generation using the current rule set.
+        Once the board is found to repeat, stored states are replayed instead of computed.
+        """
+        previous = self._current_state()
+
+        # A board replaced or edited in place since the last replayed step no longer follows the cycle
+        if self.cycle_period is not None:
+            phase = (self.generation - self.cycle_start) % self.cycle_period
+            if previous is not self._replay_state or not np.array_equal(previous, self._cycle_states[phase]):
+                self.reset_cycle_detection()
+
+        if self.cycle_period is not None:
+            phase = (self.generation + 1 - self.cycle_start) % self.cycle_period
+            self._restore(self._cycle_states[phase])
+            self._replay_state = self._current_state()
+            self.generation += 1
+        else:
+            if self.cycle_window and not self._state_hashes and not self._cycle_states:
+                self._record_state()
+            self._advance()
+            self.generation += 1
+            if self.cycle_window:
+                self._record_state()
+
+        self._update_change_indexes(previous)
         
         # Track population for musical analysis
-        population = np.sum(self.grid)
+        population = self.get_population()
         self.population_history.append(population)
         
         # Keep only last 100 generations for memory efficiency
         if len(self.population_history) > 100:
             self.population_history = self.population_history[-100:]
     
+    def fast_forward(self, k: int) -> None:
+        """
+        Advance the game by 2^k generations at once using HashLife.
+        
+        The board keeps its wrapping edges: it is advanced in chunks of up to
+        min(width, height) generations, each run on a copy padded by that many
+        wrapped cells so nothing outside the padding can reach the board.
+        
+        Args:
+            k: Power-of-two exponent of the number of generations to skip
+        """
+        previous = self._current_state()
+
+        if self._hashlife is None or not np.array_equal(self._hashlife.rule_table, self.rule_table):
+            self._hashlife = HashLife(self.rule_table)
+
+        chunk = min(k, min(self.width, self.height).bit_length() - 1)
+        margin = 1 << chunk
+        grid = self.grid
+        for _ in range(1 << (k - chunk)):
+            self._hashlife.set_grid(np.pad(grid, margin, mode='wrap'), -margin, -margin)
+            self._hashlife.step(chunk)
+            grid = self._hashlife.get_grid(0, 0, self.width, self.height)
+
+        self.grid = grid
+        self.mark_all_tiles_active()
+        self.reset_cycle_detection()
+        self._update_change_indexes(previous)
+        self.generation += 1 << k
+        self.population_history.append(self.get_population())
+        if len(self.population_history) > 100:
+            self.population_history = self.population_history[-100:]
+
     def clear_grid(self) -> None:
         """Clear all cells from the grid."""
-        self.grid.fill(False)
+        self.grid = np.zeros((self.height, self.width), dtype=bool)
+        self._births = np.zeros_like(self._births)
+        self._deaths = np.zeros_like(self._deaths)
+        self.mark_all_tiles_active()
+        self.reset_cycle_detection()
         self.generation = 0
         self.population_history = []
     
+    def get_living_coords(self) -> np.ndarray:
+        """
+        Get the coordinates of all living cells, cached until the grid changes.
+        
+        Returns:
+            Read-only integer array of shape (population, 2) holding (x, y) rows in row-major order
+        """
+        if self._living_coords is None:
+            ys, xs = np.nonzero(self.grid)
+            self._living_coords = np.column_stack((xs, ys))
+            self._living_coords.flags.writeable = False
+        return self._living_coords
+
     def get_living_cells(self) -> List[Tuple[int, int]]:
-        """Get list of coordinates of all living cells."""
-        return [(x, y) for y in range(self.height) for x in range(self.width) if self.grid[y, x]]
+        """Get list of coordinates of all living cells (a new list the caller may modify)."""
+        if self._living_cells is None:
+            self._living_cells = tuple(map(tuple, self.get_living_coords().tolist()))
+        return list(self._living_cells)
     
+    def get_population(self) -> int:
+        """Get the number of living cells."""
+        if self._population is None:
+            self._population = int(np.count_nonzero(self.grid))
+        return self._population
+
+    def get_births(self) -> np.ndarray:
+        """Get the mask of cells born in the last generation."""
+        return self._births
+
+    def get_deaths(self) -> np.ndarray:
+        """Get the mask of cells that died in the last generation."""
+        return self._deaths
+
+    def get_newborn_cells(self) -> List[Tuple[int, int]]:
+        """Get list of coordinates of cells born in the last generation."""
+        ys, xs = np.nonzero(self.get_births())
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def get_cycle(self) -> Optional[Tuple[int, int]]:
+        """
+        Get the detected cycle of the board, if any.
+        
+        Returns:
+            Tuple of (generation the cycle starts at, period), or None if no cycle was detected
+        """
+        if self.cycle_period is None:
+            return None
+        return self.cycle_start, self.cycle_period
+
     def get_cell_density(self) -> float:
         """Get the density of living cells (0.0 to 1.0)."""
-        return np.sum(self.grid) / (self.width * self.height)
+        return self.get_population() / (self.width * self.height)
     
     def get_population_change(self) -> int:
         """Get the change in population from last generation."""
@@ -282,7 +714,7 @@ class GameOfLife:
             RuleSet.DIAMOEBA: "Diamoeba - Creates amoeba-like patterns that can grow and contract",
             RuleSet.LIFE_WITHOUT_DEATH: "Life without Death - Cells never die, only grow and spread"
         }
-        return rule_info.get(self.rule_set, "Unknown rule set")
+        return rule_info.get(self.rule_set, f"Custom rule {self.rulestring}")
     
     def get_available_rule_sets(self) -> List[RuleSet]:
         """Get list of all available rule sets."""
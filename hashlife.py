@@ -0,0 +1,341 @@
+"""
+HashLife engine for fast-forwarding Life-like cellular automata.
+Represents the (unbounded) plane as a memoized quadtree so repeated
+structure in space and time is computed only once, allowing jumps of
+2^k generations in a single call.
+"""
+
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class Node:
+    """Canonical quadtree node - identical subtrees share a single instance."""
+
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(self, level: int, nw: Optional['Node'], ne: Optional['Node'],
+                 sw: Optional['Node'], se: Optional['Node'], population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+
+
+class HashLife:
+    """Memoized quadtree universe that advances by powers of two generations."""
+
+    def __init__(self, rule_table: np.ndarray, max_nodes: int = 500_000):
+        """
+        Initialize an empty universe.
+
+        Args:
+            rule_table: Boolean array of shape (2, 9) indexed by [current_state, neighbor_count]
+            max_nodes: Maximum number of cached nodes and results before eviction
+        """
+        if rule_table[0, 0]:
+            raise ValueError("HashLife requires empty space to stay empty (no B0 rules)")
+
+        self.rule_table = np.asarray(rule_table, dtype=bool)
+        self.max_nodes = max_nodes
+
+        # Canonical node table keyed by children, and memoized successors keyed by (node, step)
+        self._nodes: Dict[Tuple[Node, Node, Node, Node], Node] = {}
+        self._results: Dict[Tuple[Node, int], Node] = {}
+        self._empty = [DEAD]
+        self.evictions = 0
+
+        # Root node and the plane coordinates of its top-left corner
+        self.root = self._empty_node(3)
+        self.origin_x = -4
+        self.origin_y = -4
+        self.generation = 0
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        """Get the canonical node with the given four children."""
+        population = nw.population + ne.population + sw.population + se.population
+        if population == 0:
+            return self._empty_node(nw.level + 1)
+
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            if self.get_cache_size() >= self.max_nodes:
+                self._evict()
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            self._nodes[key] = node
+        return node
+
+    def _empty_node(self, level: int) -> Node:
+        """Get the canonical empty node at the given level."""
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(Node(smaller.level + 1, smaller, smaller, smaller, smaller, 0))
+        return self._empty[level]
+
+    def _evict(self) -> None:
+        """Drop all memoized results and rebuild the node table from the current root."""
+        self._results.clear()
+        self._nodes.clear()
+        self.evictions += 1
+
+        stack = [self.root]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in seen:
+                continue
+            seen.add(id(node))
+            self._nodes[(node.nw, node.ne, node.sw, node.se)] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+
+    def get_cache_size(self) -> int:
+        """Get the number of cached nodes plus memoized results."""
+        return len(self._nodes) + len(self._results)
+
+    def get_population(self) -> int:
+        """Get the number of living cells in the universe."""
+        return self.root.population
+
+    def _build(self, grid: np.ndarray, level: int) -> Node:
+        """Build a node from a square boolean array of side 2^level."""
+        if level == 0:
+            return ALIVE if grid[0, 0] else DEAD
+        if not grid.any():
+            return self._empty_node(level)
+
+        half = 1 << (level - 1)
+        return self._join(self._build(grid[:half, :half], level - 1),
+                          self._build(grid[:half, half:], level - 1),
+                          self._build(grid[half:, :half], level - 1),
+                          self._build(grid[half:, half:], level - 1))
+
+    def set_grid(self, grid: np.ndarray, x: int = 0, y: int = 0) -> None:
+        """
+        Replace the universe with a dense boolean grid.
+
+        Args:
+            grid: Boolean array indexed as [y, x]
+            x: Plane X coordinate of the grid's left column
+            y: Plane Y coordinate of the grid's top row
+        """
+        height, width = grid.shape
+        level = 3
+        while (1 << level) < max(width, height):
+            level += 1
+
+        size = 1 << level
+        padded = np.zeros((size, size), dtype=bool)
+        padded[:height, :width] = grid
+
+        self.root = self._build(padded, level)
+        self.origin_x = x
+        self.origin_y = y
+
+    def set_blocks(self, blocks: Dict[Tuple[int, int], np.ndarray]) -> None:
+        """
+        Replace the universe with sparse square blocks of side 2^level.
+
+        Args:
+            blocks: Boolean arrays keyed by block index (bx, by); block (bx, by)
+                    covers plane cells from (bx * size, by * size)
+        """
+        if not blocks:
+            self.root = self._empty_node(3)
+            self.origin_x = self.origin_y = -4
+            return
+
+        size = next(iter(blocks.values())).shape[0]
+        level = size.bit_length() - 1
+
+        # Shift block indices to be non-negative so halving them converges on one root
+        # (-1 >> 1 stays -1, so blocks on both sides of 0 would never merge)
+        min_bx = min(bx for bx, _ in blocks)
+        min_by = min(by for _, by in blocks)
+        nodes = {(bx - min_bx, by - min_by): self._build(block, level) for (bx, by), block in blocks.items()}
+
+        # Merge 2x2 groups of nodes into parents until a single root remains
+        while len(nodes) > 1:
+            empty = self._empty_node(level)
+            quadrants: Dict[Tuple[int, int], list] = {}
+            for (bx, by), node in nodes.items():
+                children = quadrants.setdefault((bx >> 1, by >> 1), [empty, empty, empty, empty])
+                children[(by & 1) * 2 + (bx & 1)] = node
+            nodes = {key: self._join(*children) for key, children in quadrants.items()}
+            level += 1
+
+        (bx, by), self.root = next(iter(nodes.items()))
+        self.origin_x = (bx << level) + min_bx * size
+        self.origin_y = (by << level) + min_by * size
+
+    def get_blocks(self, level: int) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Iterate over the non-empty square blocks of side 2^level in the universe.
+
+        Yields:
+            Tuples of (plane x, plane y, boolean block array) - block positions
+            follow the root's origin, so they need not be aligned to the block size
+        """
+        stack = [(self.root, self.origin_x, self.origin_y)]
+        while stack:
+            node, x, y = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level <= level:
+                block = np.zeros((1 << node.level, 1 << node.level), dtype=bool)
+                self._fill(node, block, 0, 0)
+                yield x, y, block
+                continue
+
+            half = 1 << (node.level - 1)
+            stack.extend(((node.nw, x, y), (node.ne, x + half, y),
+                          (node.sw, x, y + half), (node.se, x + half, y + half)))
+
+    def _fill(self, node: Node, out: np.ndarray, x: int, y: int) -> None:
+        """Write a node's living cells into a window array whose top-left is at plane (0, 0)."""
+        size = 1 << node.level
+        height, width = out.shape
+        if node.population == 0 or x >= width or y >= height or x + size <= 0 or y + size <= 0:
+            return
+        if node.level == 0:
+            out[y, x] = True
+            return
+
+        half = size >> 1
+        self._fill(node.nw, out, x, y)
+        self._fill(node.ne, out, x + half, y)
+        self._fill(node.sw, out, x, y + half)
+        self._fill(node.se, out, x + half, y + half)
+
+    def get_grid(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Get a dense window of the universe.
+
+        Args:
+            x: Plane X coordinate of the window's left column
+            y: Plane Y coordinate of the window's top row
+            width: Window width in cells
+            height: Window height in cells
+
+        Returns:
+            Boolean array of shape (height, width)
+        """
+        window = np.zeros((height, width), dtype=bool)
+        self._fill(self.root, window, self.origin_x - x, self.origin_y - y)
+        return window
+
+    def _expand(self, node: Node) -> Node:
+        """Surround a node with empty space, doubling its size around the same center."""
+        empty = self._empty_node(node.level - 1)
+        return self._join(self._join(empty, empty, empty, node.nw),
+                          self._join(empty, empty, node.ne, empty),
+                          self._join(empty, node.sw, empty, empty),
+                          self._join(node.se, empty, empty, empty))
+
+    def _is_padded(self, node: Node) -> bool:
+        """Check that all living cells lie in the node's center half."""
+        return (node.nw.population == node.nw.se.population and
+                node.ne.population == node.ne.sw.population and
+                node.sw.population == node.sw.ne.population and
+                node.se.population == node.se.nw.population)
+
+    def _center(self, node: Node) -> Node:
+        """Get the centered child-sized node."""
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _step_base(self, node: Node) -> Node:
+        """Advance the center 2x2 of a 4x4 node by one generation."""
+        cells = np.zeros((4, 4), dtype=np.uint8)
+        for qy, qx, quadrant in ((0, 0, node.nw), (0, 2, node.ne), (2, 0, node.sw), (2, 2, node.se)):
+            cells[qy, qx] = quadrant.nw.population
+            cells[qy, qx + 1] = quadrant.ne.population
+            cells[qy + 1, qx] = quadrant.sw.population
+            cells[qy + 1, qx + 1] = quadrant.se.population
+
+        result = []
+        for y in (1, 2):
+            for x in (1, 2):
+                neighbors = int(cells[y - 1:y + 2, x - 1:x + 2].sum()) - cells[y, x]
+                result.append(ALIVE if self.rule_table[cells[y, x], neighbors] else DEAD)
+        return self._join(*result)
+
+    def _successor(self, node: Node, step: int) -> Node:
+        """
+        Get the center half of a node advanced by 2^step generations.
+
+        Args:
+            node: Node at level 2 or above
+            step: Power-of-two exponent, at most node.level - 2
+        """
+        if node.population == 0:
+            return self._empty_node(node.level - 1)
+
+        key = (node, step)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._step_base(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+
+            # Nine overlapping sub-nodes covering the node in a 3x3 arrangement
+            n00 = nw
+            n01 = self._join(nw.ne, ne.nw, nw.se, ne.sw)
+            n02 = ne
+            n10 = self._join(nw.sw, nw.se, sw.nw, sw.ne)
+            n11 = self._join(nw.se, ne.sw, sw.ne, se.nw)
+            n12 = self._join(ne.sw, ne.se, se.nw, se.ne)
+            n20 = sw
+            n21 = self._join(sw.ne, se.nw, sw.se, se.sw)
+            n22 = se
+
+            if step == node.level - 2:
+                # Full speed: advance the nine sub-nodes half way, then the four combinations the rest
+                inner_step = step - 1
+                c = [self._successor(sub, inner_step) for sub in (n00, n01, n02, n10, n11, n12, n20, n21, n22)]
+            else:
+                # Slower than full speed: only the final four combinations advance
+                inner_step = step
+                c = [self._center(sub) for sub in (n00, n01, n02, n10, n11, n12, n20, n21, n22)]
+
+            result = self._join(
+                self._successor(self._join(c[0], c[1], c[3], c[4]), inner_step),
+                self._successor(self._join(c[1], c[2], c[4], c[5]), inner_step),
+                self._successor(self._join(c[3], c[4], c[6], c[7]), inner_step),
+                self._successor(self._join(c[4], c[5], c[7], c[8]), inner_step))
+
+        self._results[key] = result
+        return result
+
+    def step(self, k: int) -> None:
+        """
+        Advance the universe by 2^k generations in one call.
+
+        Args:
+            k: Power-of-two exponent of the number of generations
+        """
+        root = self.root
+        while root.level < k + 2 or not self._is_padded(root):
+            self.origin_x -= 1 << (root.level - 1)
+            self.origin_y -= 1 << (root.level - 1)
+            root = self._expand(root)
+
+        # One more level of padding so growth stays inside the returned center
+        self.origin_x -= 1 << (root.level - 1)
+        self.origin_y -= 1 << (root.level - 1)
+        root = self._expand(root)
+
+        # Keep the expanded root visible to eviction while the successor is computed
+        self.root = root
+        self.root = self._successor(root, k)
+        self.origin_x += 1 << (root.level - 2)
+        self.origin_y += 1 << (root.level - 2)
+        self.generation += 1 << k
@@ -9,8 +9,13 @@ Notes that are playing are visually indicated with white cells.
 import pygame
 import numpy as np
 import math
-from typing import List, Tuple, Dict, Optional, Set
+import time
+from collections import deque
+from typing import List, Tuple, Dict, Optional, Set, FrozenSet
 from game_of_life import GameOfLife
+from tone_cache import ToneCache
+from voice_mixer import VoiceMixer
+from note_events import NoteEventWriter
 
 
 class MusicGenerator:
@@ -79,12 +84,15 @@ class MusicGenerator:
     HARMONIC_MAJOR_NOTES = ['C', 'D', 'E', 'F', 'G', 'Ab', 'B']
     HUNGARIAN_MINOR_NOTES = ['C', 'D', 'Eb', 'F#', 'G', 'Ab', 'B']
 
-    def __init__(self, game: GameOfLife):
+    def __init__(self, game: GameOfLife, headless: bool = False, sample_rate: int = 22050):
         """
         Initialize the music generator.
 
         Args:
             game: GameOfLife instance to generate music from
+            headless: Don't initialize the pygame mixer; audio is only available
+                      through mixer.mix_block() (for offline rendering)
+            sample_rate: Sample rate of the synthesized audio
         """
         self.game = game
 
@@ -96,15 +104,15 @@ class MusicGenerator:
             # 'natural_minor': self.NATURAL_MINOR,
             # 'harmonic_minor': self.HARMONIC_MINOR,
             # 'melodic_minor': self.MELODIC_MINOR,
-            # 'major_pentatonic': self.MAJOR_PENTATONIC,
+            'major_pentatonic': self.MAJOR_PENTATONIC,
             # 'minor_pentatonic': self.MINOR_PENTATONIC,
             'blues': self.BLUES_SCALE,
             'chromatic': self.CHROMATIC,
             # 'ionian': self.IONIAN,
-            # 'dorian': self.DORIAN,
+            'dorian': self.DORIAN,
             # 'phrygian': self.PHRYGIAN,
             # 'lydian': self.LYDIAN,
-            # 'mixolydian': self.MIXOLYDIAN,
+            'mixolydian': self.MIXOLYDIAN,
             # 'aeolian': self.AEOLIAN,
             # 'locrian': self.LOCRIAN,
             # 'whole_tone': self.WHOLE_TONE,
@@ -124,14 +132,14 @@ class MusicGenerator:
             # 'natural_minor': self.NATURAL_MINOR_NOTES,
             # 'harmonic_minor': self.HARMONIC_MINOR_NOTES,
             # 'melodic_minor': self.MELODIC_MINOR_NOTES,
-            # 'major_pentatonic': self.MAJOR_PENTATONIC_NOTES,
+            'major_pentatonic': self.MAJOR_PENTATONIC_NOTES,
             # 'minor_pentatonic': self.MINOR_PENTATONIC_NOTES,
             'blues': self.BLUES_NOTES,
             # 'ionian': self.IONIAN_NOTES,
-            # 'dorian': self.DORIAN_NOTES,
+            'dorian': self.DORIAN_NOTES,
             # 'phrygian': self.PHRYGIAN_NOTES,
             # 'lydian': self.LYDIAN_NOTES,
-            # 'mixolydian': self.MIXOLYDIAN_NOTES,
+            'mixolydian': self.MIXOLYDIAN_NOTES,
             # 'aeolian': self.AEOLIAN_NOTES,
             # 'locrian': self.LOCRIAN_NOTES,
             # 'whole_tone': self.WHOLE_TONE_NOTES,
@@ -148,7 +156,11 @@ class MusicGenerator:
         self.base_octave = 3
 
         # Initialize pygame mixer
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        self.headless = headless
+        self.sample_rate = sample_rate
+        if not headless:
+            pygame.mixer.init(frequency=sample_rate, size=-16, channels=2, buffer=512)
+            self.sample_rate = pygame.mixer.get_init()[0]
 
         # Musical parameters
         self.note_duration = 0.3
@@ -157,17 +169,54 @@ class MusicGenerator:
         self.sustain_duration = 0.2  # How long notes sustain (like piano pedal)
         
 
-        # Active sounds tracking
-        self.active_sounds = []
-
-        # Cell note mapping for display
-        self.cell_notes = {}
-
-        # Track cell ages for newborn detection
-        self.previous_living_cells = set()
-
-        # Track which cells are currently playing notes (for white coloring)
-        self.playing_notes = set()  # Set of (x, y) coordinates
+        # All notes are summed by one software mixer streaming to a single channel
+        self.mixer = VoiceMixer(voices=32, stream=not headless)
+        self.audio_enabled = True  # Synthesize audio for notes (disable to only export events)
+
+        # Each generation's notes start together at a time on the mixer's sample clock, on a
+        # tempo grid of generation_interval seconds and at least `lookahead` seconds ahead of
+        # the mix. Headless callers control timing themselves, so notes start immediately.
+        self.schedule_notes = not headless
+        self.lookahead = 0.05
+        self.generation_interval: Optional[float] = None  # None: no tempo grid
+        self._grid_anchor: Optional[Tuple[int, int]] = None  # (generation, sample time) on the grid
+        # Tempo changes posted by set_generation_speed, applied by the thread that schedules notes
+        self._tempo_requests: deque = deque()
+        self._note_start: Optional[int] = None
+        self._note_generation = 0  # Generation whose notes are being played
+        self._notes_late = False
+
+        # Scheduling metrics (slack in samples: how far ahead of the mix a generation was scheduled)
+        self.scheduled_generations = 0
+        self.late_events = 0
+        self.grid_resyncs = 0
+        self._slack_total = 0
+        self._min_slack: Optional[int] = None
+        self._last_slack = 0
+
+        # Writers receiving every note as note-on/note-off events
+        self.event_writers: List[NoteEventWriter] = []
+
+        # Ready-to-play tones, keyed by frequency, duration, sustain and quantized volume.
+        # Cleared whenever the sustain or the mixer settings change.
+        self.tone_cache = ToneCache()
+        self.volume_steps = 100  # Volume quantization used for cache keys
+        self._cached_mixer_settings = None if headless else pygame.mixer.get_init()
+        self._tone_cache_stale = False  # Set by settings changes, cleared by the synthesizing thread
+
+        # Work buffers reused by the synthesizer, grown to the longest note seen
+        self._sample_index = np.zeros(0)
+        self._wave_buffer = np.zeros(0)
+        self._phase_buffer = np.zeros(0)
+        self._envelope_buffer = np.zeros(0)
+
+        # Per-scale note index and frequency of every cell, rebuilt when the
+        # octave settings or the grid size change
+        self._note_maps: Dict[str, Tuple[Tuple[int, int, int, int], np.ndarray, np.ndarray]] = {}
+
+        # Track which cells are currently playing notes (for white coloring). The set is
+        # replaced, never modified, so other threads can read it without locking
+        self.playing_notes: FrozenSet[Tuple[int, int]] = frozenset()  # Set of (x, y) coordinates
 
         # Musical modes
         self.modes = {
@@ -178,151 +227,216 @@ class MusicGenerator:
         }
         self.current_mode = 'position'
 
-    def _generate_tone(self, frequency: float, duration: float, volume: float = 0.3) -> pygame.mixer.Sound:
-        """Generate a pure tone with sustain effect (like piano pedal)."""
-        sample_rate = pygame.mixer.get_init()[0]
+    def _check_tone_cache(self) -> None:
+        """Clear the tone cache if the sustain or the mixer settings changed since it was filled."""
+        if self._tone_cache_stale:
+            self.tone_cache.clear()
+            self._tone_cache_stale = False
+
+        if not self.headless:
+            mixer_settings = pygame.mixer.get_init()
+            if mixer_settings != self._cached_mixer_settings:
+                self.tone_cache.clear()
+                self._cached_mixer_settings = mixer_settings
+                self.sample_rate = mixer_settings[0]
+
+    def _generate_tone(self, frequency: float, duration: float, volume: float = 0.3) -> np.ndarray:
+        """Get a pure tone with sustain effect as mono 16-bit samples, from the tone cache when possible."""
+        self._check_tone_cache()
+        volume = round(volume * self.volume_steps) / self.volume_steps
+        key = (round(frequency, 2), duration, self.sustain_duration, volume)
+
+        tone = self.tone_cache.get(key)
+        if tone is None:
+            tone = self._synthesize_tone(frequency, duration, volume)
+            self.tone_cache.put(key, tone, tone.nbytes)
+        return tone
+
+    def _generate_chord(self, frequencies: List[float], direction: str, duration: float,
+                        volume: float) -> np.ndarray:
+        """
+        Get a chord of pure tones rendered into one buffer, from the tone cache when possible.
+
+        Args:
+            frequencies: Frequencies of the chord's notes in Hz
+            direction: 'rising' or 'falling' progression, part of the cache key
+            duration: Note duration in seconds (sustain is added on top)
+            volume: Volume of each note
+
+        Returns:
+            Mono 16-bit samples of the whole chord
+        """
+        self._check_tone_cache()
+        volume = round(volume * self.volume_steps) / self.volume_steps
+        key = ('chord', self.current_scale, direction, self.base_octave, duration, self.sustain_duration, volume)
+
+        chord = self.tone_cache.get(key)
+        if chord is None:
+            chord = self._synthesize_chord(frequencies, duration, volume)
+            self.tone_cache.put(key, chord, chord.nbytes)
+        return chord
+
+    def _play_note(self, frequency: float, duration: float, volume: float,
+                   cell: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Play a note through the mixer and send it to every event writer.
+
+        Args:
+            frequency: Frequency in Hz
+            duration: Note duration in seconds (sustain is added on top)
+            volume: Note volume
+            cell: Coordinates of the cell playing the note, if any
+        """
+        if self.audio_enabled:
+            self.mixer.play(self._generate_tone(frequency, duration, volume), volume, self._note_start)
+            if self._notes_late:
+                self.late_events += 1
+
+        self._write_note_events(frequency, duration, volume, cell)
+
+    def _play_chord(self, frequencies: List[float], direction: str, duration: float, volume: float) -> None:
+        """Play a chord through the mixer as a single voice and send each note to every event writer."""
+        if self.audio_enabled:
+            self.mixer.play(self._generate_chord(frequencies, direction, duration, volume),
+                            volume * len(frequencies), self._note_start)
+            if self._notes_late:
+                self.late_events += len(frequencies)
+
+        for frequency in frequencies:
+            self._write_note_events(frequency, duration, volume)
+
+    def _write_note_events(self, frequency: float, duration: float, volume: float,
+                           cell: Optional[Tuple[int, int]] = None) -> None:
+        """Send a note to every event writer."""
+        x, y = cell if cell is not None else (-1, -1)
+        for writer in self.event_writers:
+            writer.note(self._note_generation, frequency, duration + self.sustain_duration, volume,
+                        x, y, self.current_scale, self.current_mode)
+
+    def _get_synth_buffers(self, frames: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get sample index, wave, phase and envelope work buffers of the given length."""
+        if len(self._sample_index) < frames:
+            self._sample_index = np.arange(frames, dtype=np.float64)
+            self._wave_buffer = np.empty(frames)
+            self._phase_buffer = np.empty(frames)
+            self._envelope_buffer = np.empty(frames)
+        return (self._sample_index[:frames], self._wave_buffer[:frames],
+                self._phase_buffer[:frames], self._envelope_buffer[:frames])
+
+    def _synthesize_tone(self, frequency: float, duration: float, volume: float) -> np.ndarray:
+        """Synthesize a pure tone with sustain effect (like piano pedal) as mono 16-bit samples."""
+        return self._synthesize_chord([frequency], duration, volume)
+
+    def _synthesize_chord(self, frequencies: List[float], duration: float, volume: float) -> np.ndarray:
+        """Synthesize the sum of pure tones sharing one sustain envelope as mono 16-bit samples."""
+        sample_rate = self.sample_rate
         total_duration = duration + self.sustain_duration
         frames = int(total_duration * sample_rate)
+        index, wave, phase, envelope = self._get_synth_buffers(frames)
 
-        # Generate sine wave
-        wave = np.zeros(frames)
-        t = np.linspace(0, total_duration, frames, False)
-        
         # Create sustain envelope - quick attack, long sustain, slow decay
-        envelope = np.ones(frames)
-        
+        envelope.fill(1.0)
+
         # Quick attack (first 10% of note duration)
         attack_frames = int(0.1 * duration * sample_rate)
         if attack_frames > 0:
             envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
-        
-        # Sustain phase (note duration + sustain duration)
-        sustain_start = attack_frames
+
+        # Long sustain with gradual decay (sustain duration), timed from the start of the note
         sustain_end = int(duration * sample_rate)
-        if sustain_end > sustain_start:
-            envelope[sustain_start:sustain_end] = 1.0
-        
-        # Long sustain with gradual decay (sustain duration)
         sustain_frames = int(self.sustain_duration * sample_rate)
         if sustain_frames > 0 and sustain_end + sustain_frames < frames:
-            # Gradual decay during sustain
-            decay_curve = np.exp(-t[sustain_end:sustain_end + sustain_frames] * 2)
-            envelope[sustain_end:sustain_end + sustain_frames] = decay_curve
-        
-        # Generate the wave
-        for i in range(frames):
-            wave[i] = volume * math.sin(2 * math.pi * frequency * i / sample_rate) * envelope[i]
+            decay = envelope[sustain_end:sustain_end + sustain_frames]
+            np.multiply(index[sustain_end:sustain_end + sustain_frames], -2 * total_duration / frames, out=decay)
+            np.exp(decay, out=decay)
+
+        # Generate the wave, summing the sine of every frequency
+        wave.fill(0.0)
+        for frequency in frequencies:
+            np.multiply(index, 2 * math.pi * frequency, out=phase)
+            np.divide(phase, sample_rate, out=phase)
+            np.sin(phase, out=phase)
+            np.add(wave, phase, out=wave)
+        np.multiply(wave, volume, out=wave)
+        np.multiply(wave, envelope, out=wave)
+        np.multiply(wave, 32767, out=wave)
+        np.clip(wave, -32768, 32767, out=wave)
 
         # Convert to 16-bit signed integers
-        wave = (wave * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_wave = np.zeros((frames, 2), dtype=np.int16)
-        stereo_wave[:, 0] = wave
-        stereo_wave[:, 1] = wave
+        return wave.astype(np.int16)
 
-        return pygame.mixer.Sound(stereo_wave)
-
-
-    def _get_note_frequency(self, x: int, y: int, scale: str = None) -> float:
-        """Map cell position to musical frequency."""
+    def _resolve_scale(self, scale: Optional[str] = None) -> str:
+        """Get the scale to use: the given one or the current one, falling back to 'major' if it is unknown."""
         if scale is None:
             scale = self.current_scale
+        return scale if scale in self.scales else 'major'
 
-        position = (x + y) % len(self.scales[scale])
-        base_frequency = self.scales[scale][position]
+    def _get_note_maps(self, scale: str = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the note index and frequency of every cell for a scale, building them on first use.
 
-        octave_offset = ((x * 7 + y * 11) % (self.octave_range * 2)) - self.octave_range
-        frequency = base_frequency * (2 ** octave_offset)
+        Returns:
+            Tuple of (note index, frequency) arrays of grid size
+        """
+        scale = self._resolve_scale(scale)
 
-        return frequency
+        settings = (self.octave_range, self.base_octave, self.game.height, self.game.width)
+        cached = self._note_maps.get(scale)
+        if cached is None or cached[0] != settings:
+            ys, xs = np.indices((self.game.height, self.game.width))
+            note_index = (xs + ys) % len(self.scales[scale])
 
-    def _get_note_name(self, x: int, y: int, scale: str = None) -> str:
-        """Get the note name for a cell at position (x, y)."""
-        if scale is None:
-            scale = self.current_scale
+            octave_offset = ((xs * 7 + ys * 11) % (self.octave_range * 2)) - self.octave_range
+            frequency = np.array(self.scales[scale])[note_index] * np.exp2(octave_offset)
 
-        position = (x + y) % len(self.scales[scale])
-        base_note = self.note_names[scale][position]
+            cached = (settings, note_index, frequency)
+            self._note_maps[scale] = cached
 
-        octave_offset = ((x * 7 + y * 11) % (self.octave_range * 2)) - self.octave_range
-        octave_number = self.base_octave + octave_offset
+        return cached[1], cached[2]
 
-        return f"{base_note}"
+    def _get_note_frequency(self, x: int, y: int, scale: str = None) -> float:
+        """Map cell position to musical frequency."""
+        return float(self._get_note_maps(scale)[1][y, x])
 
-    def _find_newborn_cells(self) -> List[Tuple[int, int]]:
-        """Find cells that were just born this generation."""
-        current_living_cells = set(self.game.get_living_cells())
-        newborn_cells = current_living_cells - self.previous_living_cells
-        self.previous_living_cells = current_living_cells
-        return list(newborn_cells)
+    def _get_note_name(self, x: int, y: int, scale: str = None) -> str:
+        """Get the note name for a cell at position (x, y)."""
+        scale = self._resolve_scale(scale)
+        return self.note_names[scale][self._get_note_maps(scale)[0][y, x]]
 
-    def _thin_notes_by_row(self, cells: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    def _thin_notes_by_row(self, mask: np.ndarray) -> List[Tuple[int, int]]:
         """
-        Return only the lowest frequency (highest X coordinate) newborn cell per row.
+        Return only the lowest frequency (highest X coordinate) cell of a mask per row, in row order.
         This reduces audio clutter while maintaining musical interest.
         """
-        if not cells:
-            return []
-
-        # Group cells by row (Y coordinate)
-        rows = {}
-        for x, y in cells:
-            if y not in rows:
-                rows[y] = []
-            rows[y].append((x, y))
-
-        # For each row, find the cell that would produce the lowest frequency
-        # Lower frequency = higher Y + higher X (based on the frequency calculation)
-        thinned_cells = []
-        for y, row_cells in rows.items():
-            if row_cells:
-                # Sort by X coordinate (descending) to get lowest frequency first
-                # The frequency calculation uses (x + y), so higher x = lower relative freq
-                lowest_freq_cell = max(row_cells, key=lambda cell: cell[0])
-                thinned_cells.append(lowest_freq_cell)
-
-        return thinned_cells
-
-    def _update_cell_notes(self) -> None:
-        """Update the mapping of cells to their note names."""
-        self.cell_notes.clear()
-        living_cells = self.game.get_living_cells()
-
-        for x, y in living_cells:
-            note_name = self._get_note_name(x, y)
-            self.cell_notes[(x, y)] = note_name
-
-    def _generate_position_based_music(self) -> None:
-        """Generate music based on cell positions with automatic note thinning."""
-        # Clear previous playing notes
-        self.playing_notes.clear()
+        rows = np.flatnonzero(mask.any(axis=1))
+        columns = mask.shape[1] - 1 - np.argmax(mask[rows, ::-1], axis=1)
+        return list(zip(columns.tolist(), rows.tolist()))
 
-        # Find newborn cells
-        newborn_cells = self._find_newborn_cells()
+    def _generate_position_based_music(self, game: GameOfLife) -> None:
+        """Generate music based on cell positions with automatic note thinning."""
+        # Collect this generation's playing notes, published in one assignment at the end
+        playing_notes = set()
 
         # Apply automatic thinning - only lowest note per row for newborns
-        thinned_cells = self._thin_notes_by_row(newborn_cells)
+        thinned_cells = self._thin_notes_by_row(game.get_births())
 
         # Play thinned newborn notes and mark them as playing
         for x, y in thinned_cells:
             frequency = self._get_note_frequency(x, y)
             volume = self.max_volume
 
-            sound = self._generate_tone(frequency, self.note_duration, volume)
-            channel = sound.play()
+            self._play_note(frequency, self.note_duration, volume, (x, y))
+            # Mark this cell as currently playing a note (for white coloring)
+            playing_notes.add((x, y))
 
-            if channel:
-                self.active_sounds.append(channel)
-                # Mark this cell as currently playing a note (for white coloring)
-                self.playing_notes.add((x, y))
+        self.playing_notes = frozenset(playing_notes)
 
-    def _generate_density_based_music(self) -> None:
+    def _generate_density_based_music(self, game: GameOfLife) -> None:
         """Generate music based on cell density patterns (keeps density-based scale changes)."""
-        # Clear previous playing notes
-        self.playing_notes.clear()
+        # Collect this generation's playing notes, published in one assignment at the end
+        playing_notes = set()
 
-        density = self.game.get_cell_density()
+        density = game.get_cell_density()
 
         if density > 0:
             # Map density ranges to scale families (PRESERVED FROM ORIGINAL)
@@ -345,135 +459,206 @@ class MusicGenerator:
             self.current_scale = chosen_scale
 
             # Apply thinning to density-based notes too
-            newborn_cells = self._find_newborn_cells()
-            thinned_cells = self._thin_notes_by_row(newborn_cells)
+            thinned_cells = self._thin_notes_by_row(game.get_births())
 
             for x, y in thinned_cells:
                 frequency = self._get_note_frequency(x, y, chosen_scale)
                 volume = self.max_volume * (0.5 + density * 0.5)
 
-                sound = self._generate_tone(frequency, self.note_duration, volume)
-                channel = sound.play()
+                self._play_note(frequency, self.note_duration, volume, (x, y))
+                # Mark this cell as currently playing a note (for white coloring)
+                playing_notes.add((x, y))
 
-                if channel:
-                    self.active_sounds.append(channel)
-                    # Mark this cell as currently playing a note (for white coloring)
-                    self.playing_notes.add((x, y))
+        self.playing_notes = frozenset(playing_notes)
 
-    def _generate_pattern_based_music(self) -> None:
+    def _generate_pattern_based_music(self, game: GameOfLife) -> None:
         """Generate music based on specific cell patterns."""
-        # Clear previous playing notes
-        self.playing_notes.clear()
+        # Collect this generation's playing notes, published in one assignment at the end
+        playing_notes = set()
 
-        patterns = self._analyze_patterns()
+        patterns = self._analyze_patterns(game)
+        newborn = patterns.pop('newborn')
 
-        for pattern_type, positions in patterns.items():
-            if positions:
-                base_freq = {
-                    'clusters': 300,
-                    'lines': 400,
-                    'isolated': 500,
-                    'edges': 600
-                }.get(pattern_type, 350)
+        for pattern_type, mask in patterns.items():
+            base_freq = {
+                'clusters': 300,
+                'lines': 400,
+                'isolated': 500,
+                'edges': 600
+            }.get(pattern_type, 350)
 
-                # Apply thinning to pattern-based notes as well
-                newborn_positions = [pos for pos in positions if pos in self._find_newborn_cells()]
-                thinned_positions = self._thin_notes_by_row(newborn_positions)
+            # Apply thinning to pattern-based notes as well
+            thinned_positions = self._thin_notes_by_row(mask & newborn)
 
-                for x, y in thinned_positions:
-                    frequency = base_freq + (x + y) * 10
-                    volume = self.max_volume * 0.6
+            for x, y in thinned_positions:
+                frequency = base_freq + (x + y) * 10
+                volume = self.max_volume * 0.6
 
-                    sound = self._generate_tone(frequency, self.note_duration, volume)
-                    channel = sound.play()
+                self._play_note(frequency, self.note_duration, volume, (x, y))
+                # Mark this cell as currently playing a note (for white coloring)
+                playing_notes.add((x, y))
 
-                    if channel:
-                        self.active_sounds.append(channel)
-                        # Mark this cell as currently playing a note (for white coloring)
-                        self.playing_notes.add((x, y))
+        self.playing_notes = frozenset(playing_notes)
 
-    def _generate_harmonic_music(self) -> None:
+    def _generate_harmonic_music(self, game: GameOfLife) -> None:
         """Generate harmonic music based on population dynamics."""
         # Clear previous playing notes (harmonic mode doesn't use visual feedback)
-        self.playing_notes.clear()
+        self.playing_notes = frozenset()
 
-        population_change = self.game.get_population_change()
+        population_change = game.get_population_change()
 
         if abs(population_change) > 0:
             if population_change > 0:
-                progression = [0, 2, 4, 6]
+                direction, progression = 'rising', [0, 2, 4, 6]
             else:
-                progression = [6, 4, 2, 0]
-
-            for note_index in progression:
-                if note_index < len(self.scales[self.current_scale]):
-                    frequency = self.scales[self.current_scale][note_index] * (2 ** self.base_octave)
-                    volume = self.max_volume * 0.4
-
-                    sound = self._generate_tone(frequency, self.note_duration * 1.5, volume)
-                    channel = sound.play()
-
-                    if channel:
-                        self.active_sounds.append(channel)
-                        # Note: Harmonic mode doesn't highlight specific cells since it's not position-based
-
-    def _analyze_patterns(self) -> Dict[str, List[Tuple[int, int]]]:
-        """Analyze the grid for different types of patterns."""
-        patterns = {
-            'clusters': [],
-            'lines': [],
-            'isolated': [],
-            'edges': []
-        }
-
-        living_cells = self.game.get_living_cells()
+                direction, progression = 'falling', [6, 4, 2, 0]
 
-        for x, y in living_cells:
-            neighbors = self.game.count_neighbors(x, y)
+            scale = self.scales[self._resolve_scale()]
+            frequencies = [scale[note_index] * (2 ** self.base_octave)
+                           for note_index in progression
+                           if note_index < len(scale)]
+            volume = self.max_volume * 0.4
 
-            if neighbors >= 4:
-                patterns['clusters'].append((x, y))
-            elif neighbors <= 1:
-                patterns['isolated'].append((x, y))
-            elif neighbors == 2:
-                if self._is_part_of_line(x, y):
-                    patterns['lines'].append((x, y))
+            # The progression sounds as one chord, rendered into one buffer and played as one voice
+            # Note: Harmonic mode doesn't highlight specific cells since it's not position-based
+            self._play_chord(frequencies, direction, self.note_duration * 1.5, volume)
 
-            if x == 0 or x == self.game.width - 1 or y == 0 or y == self.game.height - 1:
-                patterns['edges'].append((x, y))
+    def _analyze_patterns(self, game: GameOfLife) -> Dict[str, np.ndarray]:
+        """
+        Classify every cell of a game's grid in one pass.
 
-        return patterns
+        Returns:
+            Boolean masks of grid size: living cells in 'clusters' (4+ neighbors), 'lines'
+            (a lone horizontal or vertical neighbor pair), 'isolated' (at most 1 neighbor)
+            and on the 'edges', plus the 'newborn' cells of the last generation
+        """
+        grid = game.grid
+        neighbors = game.count_all_neighbors()
+
+        # Lines only look at neighbors inside the grid (no wrapping)
+        padded = np.pad(grid, 1)
+        cells = padded.astype(np.uint8)
+        columns = cells[:-2] + cells[1:-1] + cells[2:]
+        inside_neighbors = columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:] - cells[1:-1, 1:-1]
+        vertical = padded[:-2, 1:-1] & padded[2:, 1:-1]
+        horizontal = padded[1:-1, :-2] & padded[1:-1, 2:]
+
+        edges = np.zeros_like(grid)
+        edges[[0, -1], :] = grid[[0, -1], :]
+        edges[:, [0, -1]] = grid[:, [0, -1]]
+
+        return {
+            'clusters': grid & (neighbors >= 4),
+            'lines': grid & (neighbors == 2) & (inside_neighbors == 2) & (vertical | horizontal),
+            'isolated': grid & (neighbors <= 1),
+            'edges': edges,
+            'newborn': game.get_births()
+        }
 
-    def _is_part_of_line(self, x: int, y: int) -> bool:
-        """Check if a cell is part of a linear pattern."""
-        neighbors = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                nx, ny = x + dx, y + dy
-                if (0 <= nx < self.game.width and 0 <= ny < self.game.height and 
-                    self.game.get_cell(nx, ny)):
-                    neighbors.append((dx, dy))
+    def _schedule_generation(self, generation: int) -> None:
+        """Choose the sample clock time at which a generation's notes start."""
+        # Apply tempo changes here, so the grid is only ever changed by this thread
+        while self._tempo_requests:
+            self.generation_interval = self._tempo_requests.popleft()
+            self._grid_anchor = None
+
+        if not self.schedule_notes:
+            self._note_start = None
+            self._notes_late = False
+            return
+
+        # Measure from a running stream, whose mixed blocks are already queued ahead of playback
+        if not self.mixer.is_streaming():
+            self.mixer.update(start=True)
+
+        mixed = self.mixer.sample_clock
+        earliest = mixed + int(self.lookahead * self.sample_rate)
+        generation_interval = self.generation_interval
+        anchor = self._grid_anchor
+
+        start = slot = earliest
+        if generation_interval is not None:
+            interval = generation_interval * self.sample_rate
+            if anchor is not None:
+                anchor_generation, anchor_time = anchor
+                start = slot = round(anchor_time + (generation - anchor_generation) * interval)
+
+            # Restart the grid on the first generation, when the slot was already mixed
+            # (the notes are late) or when it is over an interval past the lookahead
+            # (pauses, tempo changes and drift between the frame and audio clocks)
+            if anchor is None or not mixed <= slot <= earliest + interval:
+                if anchor is not None:
+                    self.grid_resyncs += 1
+                self._grid_anchor = (generation, earliest)
+                start = earliest
+
+        slack = slot - mixed
+        self._note_start = start
+        self._notes_late = slack < 0
+
+        self.scheduled_generations += 1
+        self._slack_total += slack
+        self._last_slack = slack
+        self._min_slack = slack if self._min_slack is None else min(self._min_slack, slack)
+
+    def set_generation_speed(self, frames_per_generation: int, fps: float = 60.0) -> None:
+        """
+        Set the tempo grid from the visualizer's generation speed (frames per generation at fps).
+        Safe to call from any thread: the change is applied when the next generation is scheduled.
+        """
+        self._tempo_requests.append(frames_per_generation / fps)
 
-        if len(neighbors) == 2:
-            dx1, dy1 = neighbors[0]
-            dx2, dy2 = neighbors[1]
-            return (dx1 == dx2 == 0) or (dy1 == dy2 == 0) or (dx1 == dx2 and dy1 == dy2)
+    def get_timing_stats(self) -> Dict[str, float]:
+        """
+        Get note scheduling metrics.
 
-        return False
+        Returns:
+            Dictionary with the lookahead and tempo grid interval, the number of scheduled
+            generations, late notes and grid resyncs, and the last, minimum and mean
+            scheduling slack, all times in milliseconds
+        """
+        to_ms = 1000.0 / self.sample_rate
+        generations = self.scheduled_generations
+        return {
+            'lookahead_ms': self.lookahead * 1000.0,
+            'interval_ms': (self.generation_interval or 0.0) * 1000.0,
+            'generations': generations,
+            'late_events': self.late_events,
+            'resyncs': self.grid_resyncs,
+            'last_slack_ms': self._last_slack * to_ms,
+            'min_slack_ms': (self._min_slack or 0) * to_ms,
+            'mean_slack_ms': (self._slack_total / generations if generations else 0.0) * to_ms
+        }
 
-    def generate_music(self) -> None:
-        """Generate music based on current game state and mode."""
-        # Clean up finished sounds
-        self.active_sounds = [s for s in self.active_sounds if s.get_busy()]
+    def generate_music(self, game: Optional[GameOfLife] = None) -> None:
+        """
+        Generate music based on a game state and the current mode.
 
-        # Update cell notes for display
-        self._update_cell_notes()
+        Args:
+            game: Board state to play (default: self.game), e.g. a snapshot of it taken on another thread
+        """
+        if game is None:
+            game = self.game
+        self._note_generation = game.generation
+        self._schedule_generation(game.generation)
 
         # Generate new music
         if self.current_mode in self.modes:
-            self.modes[self.current_mode]()
+            self.modes[self.current_mode](game)
+
+        self.update_audio()
+
+    def update_audio(self) -> None:
+        """Feed the mixer's output channel; call every frame so playback never runs dry."""
+        self.mixer.update()
+
+    def wait(self, duration: float) -> None:
+        """Wait for a number of seconds while keeping the audio stream fed (for scripts without a frame loop)."""
+        poll_interval = self.mixer.block_frames / self.sample_rate / 4
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            self.update_audio()
+            time.sleep(min(poll_interval, max(0.0, end - time.perf_counter())))
 
     def is_cell_playing_note(self, x: int, y: int) -> bool:
         """
@@ -489,14 +674,38 @@ class MusicGenerator:
         """
         return (x, y) in self.playing_notes
 
+    def get_playing_note_mask(self) -> np.ndarray:
+        """Get a boolean array of grid size marking the cells currently playing a note."""
+        playing_notes = self.playing_notes
+        mask = np.zeros((self.game.height, self.game.width), dtype=bool)
+        if playing_notes:
+            xs, ys = np.array(list(playing_notes)).T
+            mask[ys, xs] = True
+        return mask
+
     def get_cell_note(self, x: int, y: int) -> Optional[str]:
         """Get the note name for a specific cell position."""
-        return self.cell_notes.get((x, y))
+        if 0 <= x < self.game.width and 0 <= y < self.game.height:
+            return self._get_note_name(x, y)
+        return None
+
+    def get_note_index_map(self, scale: Optional[str] = None) -> np.ndarray:
+        """Get the index into get_note_names() of every cell for a scale (default: current), as an array of grid size."""
+        return self._get_note_maps(scale)[0]
+
+    def get_frequency_map(self, scale: Optional[str] = None) -> np.ndarray:
+        """Get the frequency of every cell in Hz for a scale (default: current), as an array of grid size."""
+        return self._get_note_maps(scale)[1]
+
+    def get_note_names(self, scale: Optional[str] = None) -> List[str]:
+        """Get the note names of a scale (default: the current one), falling back to 'major' if it is unknown."""
+        return self.note_names[self._resolve_scale(scale)]
 
     def set_scale(self, scale: str) -> None:
-        """Set the musical scale to use."""
+        """Set the musical scale to use and build its note maps."""
         if scale in self.scales:
             self.current_scale = scale
+            self._get_note_maps()
 
     def set_mode(self, mode: str) -> None:
         """Set the musical generation mode."""
@@ -510,14 +719,27 @@ class MusicGenerator:
     def set_sustain_duration(self, duration: float) -> None:
         """Set the sustain duration for notes (like piano pedal)."""
         self.sustain_duration = max(0.0, min(3.0, duration))
+        self._tone_cache_stale = True
+
+
+    def add_event_writer(self, writer: NoteEventWriter) -> None:
+        """Send every generated note to an event writer (e.g. a MidiFileWriter)."""
+        self.event_writers.append(writer)
 
+    def remove_event_writer(self, writer: NoteEventWriter) -> None:
+        """Stop sending notes to an event writer and close it."""
+        self.event_writers.remove(writer)
+        writer.close()
 
     def stop_all_sounds(self) -> None:
         """Stop all currently playing sounds."""
-        pygame.mixer.stop()
-        self.active_sounds = []
+        self.mixer.stop_all()
 
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop_all_sounds()
-        pygame.mixer.quit()
+        for writer in self.event_writers:
+            writer.close()
+        self.event_writers = []
+        if not self.headless:
+            pygame.mixer.quit()
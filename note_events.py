@@ -0,0 +1,231 @@
+"""
+Note event export for the music generator.
+Writers turn generated notes into time-ordered note-on/note-off events and
+append them to a Standard MIDI File or a compact binary event log,
+buffering encoded events and flushing them to disk in batches.
+"""
+
+import heapq
+import math
+import struct
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, List, NamedTuple, Tuple
+
+
+class NoteEvent(NamedTuple):
+    """A note-on or note-off event, timed in ticks with one beat per generation."""
+    tick: int
+    on: bool
+    note: int
+    velocity: int
+    generation: int
+    x: int  # -1 for notes that don't come from a cell
+    y: int
+    scale: str
+    mode: str
+
+
+class NoteEventWriter(ABC):
+    """Base writer: orders note-on/note-off events and flushes encoded events in batches."""
+
+    def __init__(self, path: str, tempo: float = 180.0, ticks_per_beat: int = 480,
+                 start_generation: int = 0, flush_bytes: int = 64 * 1024):
+        """
+        Open the output file and write its header.
+
+        Args:
+            path: Output file
+            tempo: Generations per minute, used to time note-offs
+            ticks_per_beat: Time resolution; one beat is one generation
+            start_generation: Generation placed at time zero
+            flush_bytes: Encoded bytes buffered before writing to disk
+        """
+        self.tempo = tempo
+        self.ticks_per_beat = ticks_per_beat
+        self.start_generation = start_generation
+        self.flush_bytes = flush_bytes
+        self.events_written = 0
+
+        self._file: BinaryIO = open(path, 'wb')
+        self._buffer = bytearray()
+        self._pending_offs: List[Tuple[int, int, NoteEvent]] = []  # Heap of (tick, order, event)
+        self._order = 0
+        self._last_tick = 0
+        self._write_header()
+
+    def note(self, generation: int, frequency: float, duration: float, volume: float,
+             x: int, y: int, scale: str, mode: str) -> None:
+        """
+        Record a note as a note-on now and a note-off after its duration.
+
+        Args:
+            generation: Generation the note was played in
+            frequency: Frequency in Hz, rounded to the nearest MIDI note
+            duration: Sounding length in seconds
+            volume: Volume from 0.0 to 1.0, scaled to MIDI velocity
+            x: X coordinate of the cell playing the note, or -1
+            y: Y coordinate of the cell playing the note, or -1
+            scale: Current musical scale
+            mode: Current musical mode
+        """
+        tick = max(self._last_tick, (generation - self.start_generation) * self.ticks_per_beat)
+        self._write_pending_offs(tick)
+
+        note = min(127, max(0, round(69 + 12 * math.log2(frequency / 440.0))))
+        velocity = min(127, max(1, round(volume * 127)))
+        on = NoteEvent(tick, True, note, velocity, generation, x, y, scale, mode)
+        self._write_event(on)
+
+        off_tick = tick + max(1, round(duration * self.tempo / 60.0 * self.ticks_per_beat))
+        heapq.heappush(self._pending_offs, (off_tick, self._order, on._replace(tick=off_tick, on=False, velocity=0)))
+        self._order += 1
+
+    def _write_pending_offs(self, tick: int) -> None:
+        """Write every pending note-off due at or before tick."""
+        while self._pending_offs and self._pending_offs[0][0] <= tick:
+            self._write_event(heapq.heappop(self._pending_offs)[2])
+
+    def _write_event(self, event: NoteEvent) -> None:
+        """Encode an event into the buffer, flushing when it is full."""
+        self._buffer += self._encode(event)
+        self._last_tick = event.tick
+        self.events_written += 1
+        if len(self._buffer) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events to disk."""
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self) -> None:
+        """Write the remaining note-offs, finish the file and close it."""
+        if self._file.closed:
+            return
+        self._write_pending_offs(math.inf)
+        self.flush()
+        self._finish()
+        self._file.close()
+
+    def __enter__(self) -> 'NoteEventWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @abstractmethod
+    def _write_header(self) -> None:
+        """Write the file header."""
+
+    @abstractmethod
+    def _encode(self, event: NoteEvent) -> bytes:
+        """Encode one event."""
+
+    @abstractmethod
+    def _finish(self) -> None:
+        """Complete the file after the last event has been flushed."""
+
+
+class MidiFileWriter(NoteEventWriter):
+    """
+    Standard MIDI File (format 0, one track). Generation numbers are written as
+    markers, scale and mode changes as text events and cell coordinates as cue points.
+    """
+
+    def _write_header(self) -> None:
+        """Write the MThd chunk, the MTrk chunk header and the tempo."""
+        self._file.write(b'MThd' + struct.pack('>IHHH', 6, 0, 1, self.ticks_per_beat))
+        self._file.write(b'MTrk')
+        self._length_offset = self._file.tell()
+        self._file.write(struct.pack('>I', 0))  # Track length, patched in _finish()
+
+        microseconds_per_beat = round(60_000_000 / self.tempo)
+        self._buffer += b'\x00\xff\x51\x03' + microseconds_per_beat.to_bytes(3, 'big')
+        self._event_tick = 0
+        self._generation = None
+        self._scale_mode = None
+
+    @staticmethod
+    def _variable_length(value: int) -> bytes:
+        """Encode a MIDI variable-length quantity."""
+        data = [value & 0x7f]
+        value >>= 7
+        while value:
+            data.append(0x80 | (value & 0x7f))
+            value >>= 7
+        return bytes(reversed(data))
+
+    def _meta(self, kind: int, text: str) -> bytes:
+        """Encode a text-like meta event at the current tick."""
+        data = text.encode('utf-8')
+        return b'\x00\xff' + bytes([kind]) + self._variable_length(len(data)) + data
+
+    def _encode(self, event: NoteEvent) -> bytes:
+        """Encode a note message, preceded by markers for new generations, scales and modes."""
+        data = self._variable_length(event.tick - self._event_tick)
+        self._event_tick = event.tick
+
+        if event.on:
+            # The delta time goes on the first meta event, the note follows at delta zero
+            meta = b''
+            if event.generation != self._generation:
+                self._generation = event.generation
+                meta += self._meta(0x06, f"generation {event.generation}")
+            if (event.scale, event.mode) != self._scale_mode:
+                self._scale_mode = (event.scale, event.mode)
+                meta += self._meta(0x01, f"scale {event.scale} mode {event.mode}")
+            if event.x >= 0:
+                meta += self._meta(0x07, f"cell {event.x},{event.y}")
+            if meta:
+                data = data + meta[1:] + b'\x00'
+
+        status = 0x90 if event.on else 0x80
+        return data + bytes([status, event.note, event.velocity])
+
+    def _finish(self) -> None:
+        """Write the end-of-track event and patch the track length."""
+        self._file.write(b'\x00\xff\x2f\x00')  # End of track
+        length = self._file.tell() - self._length_offset - 4
+        self._file.seek(self._length_offset)
+        self._file.write(struct.pack('>I', length))
+
+
+class EventLogWriter(NoteEventWriter):
+    """
+    Compact binary event log with every field of every event.
+
+    The file starts with b'GOLE', a version byte and the tempo and ticks per beat
+    ('<fH'). Each record starts with a kind byte: 0/1 is a note-off/note-on
+    ('<IIhhBBBB': tick, generation, x, y, note, velocity, scale id, mode id),
+    2/3 defines a scale/mode name ('<BB' id and length, then UTF-8 name).
+    """
+
+    VERSION = 1
+    NOTE = struct.Struct('<BIIhhBBBB')
+
+    def _write_header(self) -> None:
+        """Write the magic number, version, tempo and resolution."""
+        self._file.write(b'GOLE' + struct.pack('<BfH', self.VERSION, self.tempo, self.ticks_per_beat))
+        self._names: Dict[Tuple[int, str], int] = {}
+
+    def _name_id(self, kind: int, name: str) -> Tuple[int, bytes]:
+        """Get the id of a scale or mode name, and the record defining it if it is new."""
+        key = (kind, name)
+        if key in self._names:
+            return self._names[key], b''
+
+        name_id = sum(1 for other_kind, _ in self._names if other_kind == kind)
+        self._names[key] = name_id
+        data = name.encode('utf-8')
+        return name_id, struct.pack('<BBB', kind, name_id, len(data)) + data
+
+    def _encode(self, event: NoteEvent) -> bytes:
+        """Encode a note record, preceded by definitions of new scale and mode names."""
+        scale_id, scale_definition = self._name_id(2, event.scale)
+        mode_id, mode_definition = self._name_id(3, event.mode)
+        return scale_definition + mode_definition + self.NOTE.pack(
+            int(event.on), event.tick, event.generation, event.x, event.y,
+            event.note, event.velocity, scale_id, mode_id)
+
+    def _finish(self) -> None:
+        """Nothing follows the last record."""
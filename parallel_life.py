@@ -0,0 +1,156 @@
+"""
+Multi-process Game of Life stepping over shared memory.
+The grid is split into horizontal bands, one per worker process. Each
+generation every worker reads its band plus a one-row halo above and below
+(wrapping at the board edges) from the shared current buffer and writes its
+band of the next generation into the shared back buffer.
+"""
+
+import multiprocessing as mp
+import numpy as np
+import weakref
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+
+def _band_worker(connection, buffer_names: List[str], width: int, height: int, y0: int, y1: int) -> None:
+    """
+    Worker loop stepping rows y0..y1 of the shared grid.
+
+    Args:
+        connection: Pipe end receiving (source_index, rule_table) commands, or None to stop
+        buffer_names: Names of the two shared memory grid buffers
+        width: Grid width in cells
+        height: Grid height in cells
+        y0: First row of this worker's band
+        y1: Row after the last row of this worker's band
+    """
+    buffers = [shared_memory.SharedMemory(name=name) for name in buffer_names]
+    grids = [np.ndarray((height, width), dtype=bool, buffer=shm.buf) for shm in buffers]
+
+    # Band rows plus the halo rows owned by the neighboring bands
+    rows = np.arange(y0 - 1, y1 + 1) % height
+
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+
+            source, rule_table = message
+            cells = grids[source][rows].astype(np.uint8)
+
+            columns = cells[:-2] + cells[1:-1] + cells[2:]
+            core = cells[1:-1]
+            neighbors = columns + np.roll(columns, 1, axis=1) + np.roll(columns, -1, axis=1) - core
+            grids[1 - source][y0:y1] = rule_table[core, neighbors]
+
+            connection.send(True)
+    finally:
+        del grids
+        for shm in buffers:
+            shm.close()
+
+
+def _release_pool(connections: list, processes: list, buffers: list) -> None:
+    """
+    Stop the worker processes and unlink the shared memory of a pool.
+
+    Args:
+        connections: Pipe ends of the workers
+        processes: Worker processes
+        buffers: Shared memory grid buffers
+    """
+    for connection in connections:
+        try:
+            connection.send(None)
+        except OSError:
+            pass  # Worker already gone
+    for process in processes:
+        process.join(timeout=1)
+        if process.is_alive():
+            process.terminate()
+    connections.clear()
+    processes.clear()
+
+    for shm in buffers:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # A grid view is still alive; the mapping goes away with it
+        shm.unlink()
+    buffers.clear()
+
+
+class ParallelStepper:
+    """
+    Pool of worker processes stepping horizontal bands of a shared grid.
+    Call close() or use it as a context manager; a pool that is garbage
+    collected or still open at exit is released automatically.
+    """
+
+    def __init__(self, width: int, height: int, workers: Optional[int] = None):
+        """
+        Start the worker pool.
+
+        Args:
+            width: Grid width in cells
+            height: Grid height in cells
+            workers: Number of worker processes (defaults to the CPU count)
+        """
+        self.width = width
+        self.height = height
+        self.workers = max(1, min(workers or mp.cpu_count(), height))
+
+        # Double-buffered grid in shared memory
+        self._buffers = [shared_memory.SharedMemory(create=True, size=max(1, width * height)) for _ in range(2)]
+        self.grids = [np.ndarray((height, width), dtype=bool, buffer=shm.buf) for shm in self._buffers]
+        self.current = 0
+
+        bounds = np.linspace(0, height, self.workers + 1).astype(int)
+        self._connections = []
+        self._processes = []
+        for y0, y1 in zip(bounds[:-1], bounds[1:]):
+            parent_end, child_end = mp.Pipe()
+            process = mp.Process(target=_band_worker,
+                                 args=(child_end, [shm.name for shm in self._buffers],
+                                       width, height, int(y0), int(y1)),
+                                 daemon=True)
+            process.start()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+        self._finalizer = weakref.finalize(self, _release_pool, self._connections, self._processes, self._buffers)
+
+    def __enter__(self) -> 'ParallelStepper':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def step(self, grid: np.ndarray, rule_table: np.ndarray) -> np.ndarray:
+        """
+        Compute the next generation across all workers.
+
+        Args:
+            grid: Current boolean grid (copied into shared memory unless it already lives there)
+            rule_table: Boolean array of shape (2, 9) indexed by [current_state, neighbor_count]
+
+        Returns:
+            The next generation, as a view of shared memory that is reused two steps later
+        """
+        if grid is not self.grids[self.current]:
+            self.grids[self.current][:] = grid
+
+        for connection in self._connections:
+            connection.send((self.current, rule_table))
+        for connection in self._connections:
+            connection.recv()
+
+        self.current = 1 - self.current
+        return self.grids[self.current]
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        self.grids = []
+        self._finalizer()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Offline renderer for Musical Conway's Game of Life.
+Runs a session headless - no window and no audio device - and streams the
+mixed audio to a WAV file in fixed-size chunks, faster than real time and
+in constant memory however long the render is. The notes can also be
+exported as a Standard MIDI File or a binary event log, with or without audio.
+"""
+
+import argparse
+import os
+import sys
+import time
+import wave
+import numpy as np
+from typing import Optional, Union
+
+# Add current directory to path for imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from game_of_life import GameOfLife, RuleSet
+from music_generator import MusicGenerator
+from note_events import EventLogWriter, MidiFileWriter
+
+
+def _parse_rule_set(value: str) -> Union[RuleSet, str]:
+    """Get the preset named by value, or value itself as a rulestring."""
+    try:
+        return RuleSet(value)
+    except ValueError:
+        return value
+
+
+def _write_frames(wav: wave.Wave_write, music_gen: MusicGenerator, frames: int, stereo: np.ndarray) -> None:
+    """Mix a number of frames and append them to the WAV file, one block at a time."""
+    while frames > 0:
+        count = min(frames, len(stereo))
+        mix = music_gen.mixer.mix_block(count)
+        np.clip(mix, -32768, 32767, out=mix)
+        stereo[:count] = mix[:, None]
+        wav.writeframes(stereo[:count])
+        frames -= count
+
+
+def render_session(path: Optional[str], pattern: str = 'glider', rule_set: Union[RuleSet, str] = RuleSet.CONWAY,
+                   scale: str = 'major', mode: str = 'position', generations: int = 100,
+                   tempo: float = 180.0, width: int = 60, height: int = 40,
+                   sample_rate: int = 22050, midi_path: Optional[str] = None,
+                   event_log_path: Optional[str] = None) -> float:
+    """
+    Render a session to a 16-bit stereo WAV file and/or note event files.
+
+    Args:
+        path: Output WAV file, or None to skip audio synthesis
+        pattern: Name of the starting pattern (see GameOfLife.get_patterns()), placed centered
+        rule_set: Preset rule set or any Life-like rulestring
+        scale: Musical scale
+        mode: Musical mode
+        generations: Number of generations to render
+        tempo: Generations per minute
+        width: Grid width in cells
+        height: Grid height in cells
+        sample_rate: Output sample rate
+        midi_path: Standard MIDI File to export the notes to
+        event_log_path: Binary event log to export the notes to
+
+    Returns:
+        Length of the rendered session in seconds
+    """
+    game = GameOfLife(width, height, rule_set)
+    patterns = game.get_patterns()
+    if pattern not in patterns:
+        raise ValueError(f"Unknown pattern '{pattern}', expected one of {list(patterns)}")
+    cells = patterns[pattern]
+    game.add_pattern(cells, (width - len(cells[0])) // 2, (height - len(cells)) // 2)
+
+    music_gen = MusicGenerator(game, headless=True, sample_rate=sample_rate)
+    if scale not in music_gen.scales:
+        raise ValueError(f"Unknown scale '{scale}', expected one of {list(music_gen.scales)}")
+    if mode not in music_gen.modes:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {list(music_gen.modes)}")
+    music_gen.set_scale(scale)
+    music_gen.set_mode(mode)
+
+    # Events are timed from the first rendered generation, like the audio
+    if midi_path:
+        music_gen.add_event_writer(MidiFileWriter(midi_path, tempo, start_generation=game.generation + 1))
+    if event_log_path:
+        music_gen.add_event_writer(EventLogWriter(event_log_path, tempo, start_generation=game.generation + 1))
+
+    if path is None:
+        music_gen.audio_enabled = False
+        for _ in range(generations):
+            game.next_generation()
+            music_gen.generate_music()
+        music_gen.cleanup()
+        return generations * 60.0 / tempo
+
+    frames_per_generation = sample_rate * 60.0 / tempo
+    stereo = np.empty((music_gen.mixer.block_frames, 2), dtype=np.int16)
+    written = 0
+
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+
+        for generation in range(generations):
+            game.next_generation()
+            music_gen.generate_music()
+
+            # Round each generation's end, so timing doesn't drift over long renders
+            end = round((generation + 1) * frames_per_generation)
+            _write_frames(wav, music_gen, end - written, stereo)
+            written = end
+
+        # Let the last notes ring out
+        while music_gen.mixer.get_active_voice_count() > 0:
+            _write_frames(wav, music_gen, len(stereo), stereo)
+            written += len(stereo)
+
+    music_gen.cleanup()
+    return written / sample_rate
+
+
+def main():
+    """Parse arguments and render a session."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', nargs='?', help="Output WAV file (omit to only export events)")
+    parser.add_argument('--pattern', default='glider', help="Starting pattern")
+    parser.add_argument('--rule-set', type=_parse_rule_set, default=RuleSet.CONWAY,
+                        help="Preset rule set name (e.g. highlife) or rulestring (e.g. B36/S23)")
+    parser.add_argument('--scale', default='major', help="Musical scale")
+    parser.add_argument('--mode', default='position', help="Musical mode")
+    parser.add_argument('--generations', type=int, default=100, help="Generations to render")
+    parser.add_argument('--tempo', type=float, default=180.0, help="Generations per minute")
+    parser.add_argument('--width', type=int, default=60, help="Grid width in cells")
+    parser.add_argument('--height', type=int, default=40, help="Grid height in cells")
+    parser.add_argument('--sample-rate', type=int, default=22050, help="Output sample rate")
+    parser.add_argument('--midi', help="Also export the notes as a Standard MIDI File")
+    parser.add_argument('--events', help="Also export the notes as a binary event log")
+    args = parser.parse_args()
+    if not (args.output or args.midi or args.events):
+        parser.error("nothing to render: give an output WAV file, --midi or --events")
+
+    start = time.perf_counter()
+    try:
+        duration = render_session(args.output, args.pattern, args.rule_set, args.scale, args.mode,
+                                  args.generations, args.tempo, args.width, args.height, args.sample_rate,
+                                  args.midi, args.events)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    outputs = ", ".join(path for path in (args.output, args.midi, args.events) if path)
+    print(f"Rendered {args.generations} generations ({duration:.1f}s) "
+          f"to {outputs} in {elapsed:.1f}s ({duration / elapsed:.1f}x real time)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Sparse, unbounded Game of Life world for low-density patterns.
+Cells live on an infinite plane stored as fixed-size chunks that are only
+allocated where cells are alive. The GameOfLife API is served through a
+movable viewport, so MusicGenerator and the visualizer work unchanged.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
+from game_of_life import RULE_PRESETS, GameOfLife, RuleSet, compile_rule
+from hashlife import HashLife
+
+
+CHUNK_SIZE = 32  # Must be a power of two for HashLife fast-forwarding
+
+
+class SparseWorld(GameOfLife):
+    """Unbounded Game of Life stored as chunks, viewed through a width x height viewport."""
+
+    def __init__(self, width: int = 50, height: int = 50, rule_set: Union[RuleSet, str] = RuleSet.CONWAY):
+        """
+        Initialize an empty world.
+
+        Args:
+            width: Viewport width in cells
+            height: Viewport height in cells
+            rule_set: Preset rule set or any Life-like rulestring without B0
+        """
+        # Living chunks keyed by chunk index (cx, cy) in world coordinates
+        self.chunks: Dict[Tuple[int, int], np.ndarray] = {}
+
+        # World coordinates of the viewport's top-left cell
+        self.viewport_x = 0
+        self.viewport_y = 0
+
+        # A repeating viewport doesn't mean the world repeats, so cycle detection stays off
+        super().__init__(width, height, rule_set, cycle_window=0)
+
+        self.engines = {
+            'sparse': self._next_chunks_sparse
+        }
+        self.engine = 'sparse'
+
+    def _apply_rule_set(self, rule_set: Union[RuleSet, str]) -> None:
+        """Compile a rule set, rejecting rules that would fill the infinite plane."""
+        # Check before installing anything, so a rejected rule leaves the current one in place
+        rulestring = RULE_PRESETS[rule_set] if isinstance(rule_set, RuleSet) else rule_set
+        if compile_rule(rulestring)[3][0, 0]:
+            raise ValueError("Unbounded worlds require empty space to stay empty (no B0 rules)")
+        super()._apply_rule_set(rule_set)
+
+    # Viewport
+
+    def set_viewport(self, x: int, y: int) -> None:
+        """Move the viewport's top-left corner to world coordinates (x, y)."""
+        self.viewport_x = x
+        self.viewport_y = y
+
+    def move_viewport(self, dx: int, dy: int) -> None:
+        """Pan the viewport by (dx, dy) cells."""
+        self.set_viewport(self.viewport_x + dx, self.viewport_y + dy)
+
+    def center_viewport(self) -> None:
+        """Center the viewport on the bounding box of all living cells."""
+        box = self.get_bounding_box()
+        if box is not None:
+            min_x, min_y, max_x, max_y = box
+            self.set_viewport((min_x + max_x - self.width) // 2 + 1, (min_y + max_y - self.height) // 2 + 1)
+
+    # World-coordinate access
+
+    def get_world_cell(self, x: int, y: int) -> bool:
+        """Get the state of the cell at world coordinates (x, y)."""
+        chunk = self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        return bool(chunk[y % CHUNK_SIZE, x % CHUNK_SIZE]) if chunk is not None else False
+
+    def set_world_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set the state of the cell at world coordinates (x, y)."""
+        key = (x // CHUNK_SIZE, y // CHUNK_SIZE)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if not alive:
+                return
+            chunk = self.chunks[key] = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=bool)
+
+        chunk[y % CHUNK_SIZE, x % CHUNK_SIZE] = alive
+        if not alive and not chunk.any():
+            del self.chunks[key]
+
+    def get_world_region(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """Get a dense boolean array of the world region with top-left (x, y)."""
+        region = np.zeros((height, width), dtype=bool)
+        for cy in range(y // CHUNK_SIZE, (y + height - 1) // CHUNK_SIZE + 1):
+            for cx in range(x // CHUNK_SIZE, (x + width - 1) // CHUNK_SIZE + 1):
+                chunk = self.chunks.get((cx, cy))
+                if chunk is None:
+                    continue
+                x0, y0 = max(x, cx * CHUNK_SIZE), max(y, cy * CHUNK_SIZE)
+                x1, y1 = min(x + width, (cx + 1) * CHUNK_SIZE), min(y + height, (cy + 1) * CHUNK_SIZE)
+                region[y0 - y:y1 - y, x0 - x:x1 - x] = chunk[y0 - cy * CHUNK_SIZE:y1 - cy * CHUNK_SIZE,
+                                                             x0 - cx * CHUNK_SIZE:x1 - cx * CHUNK_SIZE]
+        return region
+
+    def set_world_region(self, x: int, y: int, region: np.ndarray) -> None:
+        """Overwrite the world region with top-left (x, y) with a dense boolean array."""
+        height, width = region.shape
+        for cy in range(y // CHUNK_SIZE, (y + height - 1) // CHUNK_SIZE + 1):
+            for cx in range(x // CHUNK_SIZE, (x + width - 1) // CHUNK_SIZE + 1):
+                x0, y0 = max(x, cx * CHUNK_SIZE), max(y, cy * CHUNK_SIZE)
+                x1, y1 = min(x + width, (cx + 1) * CHUNK_SIZE), min(y + height, (cy + 1) * CHUNK_SIZE)
+                part = region[y0 - y:y1 - y, x0 - x:x1 - x]
+
+                chunk = self.chunks.get((cx, cy))
+                if chunk is None:
+                    if not part.any():
+                        continue
+                    chunk = self.chunks[(cx, cy)] = np.zeros((CHUNK_SIZE, CHUNK_SIZE), dtype=bool)
+
+                chunk[y0 - cy * CHUNK_SIZE:y1 - cy * CHUNK_SIZE, x0 - cx * CHUNK_SIZE:x1 - cx * CHUNK_SIZE] = part
+                if not chunk.any():
+                    del self.chunks[(cx, cy)]
+
+    def get_world_population(self) -> int:
+        """Get the number of living cells in the whole world."""
+        return int(sum(np.count_nonzero(chunk) for chunk in self.chunks.values()))
+
+    def get_chunk_count(self) -> int:
+        """Get the number of allocated chunks."""
+        return len(self.chunks)
+
+    def get_bounding_box(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Get the bounding box of all living cells in world coordinates.
+
+        Returns:
+            Tuple of (min_x, min_y, max_x, max_y), inclusive, or None if the world is empty
+        """
+        if not self.chunks:
+            return None
+
+        xs, ys = [], []
+        for (cx, cy), chunk in self.chunks.items():
+            columns = np.flatnonzero(chunk.any(axis=0))
+            rows = np.flatnonzero(chunk.any(axis=1))
+            xs.extend((cx * CHUNK_SIZE + columns[0], cx * CHUNK_SIZE + columns[-1]))
+            ys.extend((cy * CHUNK_SIZE + rows[0], cy * CHUNK_SIZE + rows[-1]))
+        return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
+
+    # GameOfLife API, in viewport coordinates
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Dense copy of the viewport (modifying it does not change the world)."""
+        return self.get_world_region(self.viewport_x, self.viewport_y, self.width, self.height)
+
+    @grid.setter
+    def grid(self, value: np.ndarray) -> None:
+        """Overwrite the viewport with a dense boolean grid."""
+        self.set_world_region(self.viewport_x, self.viewport_y, np.asarray(value, dtype=bool))
+
+    def set_cell(self, x: int, y: int, alive: bool) -> None:
+        """Set the state of a cell at viewport position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.set_world_cell(self.viewport_x + x, self.viewport_y + y, alive)
+
+    def get_cell(self, x: int, y: int) -> bool:
+        """Get the state of a cell at viewport position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.get_world_cell(self.viewport_x + x, self.viewport_y + y)
+        return False
+
+    def toggle_cell(self, x: int, y: int) -> None:
+        """Toggle the state of a cell at viewport position (x, y)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.set_cell(x, y, not self.get_cell(x, y))
+
+    def count_neighbors(self, x: int, y: int) -> int:
+        """Count living neighbors around the cell at viewport position (x, y), including off-screen cells."""
+        world_x, world_y = self.viewport_x + x, self.viewport_y + y
+        count = 0
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                if dx == 0 and dy == 0:
+                    continue
+                if self.get_world_cell(world_x + dx, world_y + dy):
+                    count += 1
+        return count
+
+    def count_all_neighbors(self) -> np.ndarray:
+        """Count living neighbors of every viewport cell, including off-screen cells."""
+        cells = self.get_world_region(self.viewport_x - 1, self.viewport_y - 1,
+                                      self.width + 2, self.height + 2).astype(np.uint8)
+        columns = cells[:-2] + cells[1:-1] + cells[2:]
+        return columns[:, :-2] + columns[:, 1:-1] + columns[:, 2:] - cells[1:-1, 1:-1]
+
+    def clear_grid(self) -> None:
+        """Clear all cells from the world."""
+        self.chunks = {}
+        self._births = np.zeros((self.height, self.width), dtype=bool)
+        self._deaths = np.zeros((self.height, self.width), dtype=bool)
+        self.generation = 0
+        self.population_history = []
+
+    def get_living_coords(self) -> np.ndarray:
+        """Get the viewport (x, y) coordinates of living cells as an array of shape (population, 2)."""
+        ys, xs = np.nonzero(self.grid)
+        return np.column_stack((xs, ys))
+
+    def get_living_cells(self) -> List[Tuple[int, int]]:
+        """Get list of viewport coordinates of all living cells in the viewport."""
+        ys, xs = np.nonzero(self.grid)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def get_population(self) -> int:
+        """Get the number of living cells in the viewport."""
+        return int(np.count_nonzero(self.grid))
+
+    # Stepping
+
+    def _next_chunks_sparse(self) -> Dict[Tuple[int, int], np.ndarray]:
+        """Compute the next generation for every chunk that has or may gain living cells."""
+        chunks = self.chunks
+
+        # Living chunks, plus neighbors that cells on a chunk's border can spread into
+        candidates = set(chunks)
+        for (cx, cy), chunk in chunks.items():
+            top, bottom = chunk[0].any(), chunk[-1].any()
+            left, right = chunk[:, 0].any(), chunk[:, -1].any()
+            for dx, dy, edge in ((0, -1, top), (0, 1, bottom), (-1, 0, left), (1, 0, right),
+                                 (-1, -1, chunk[0, 0]), (1, -1, chunk[0, -1]),
+                                 (-1, 1, chunk[-1, 0]), (1, 1, chunk[-1, -1])):
+                if edge:
+                    candidates.add((cx + dx, cy + dy))
+
+        if not candidates:
+            return {}
+
+        # Gather every candidate with a one-cell halo from its eight neighbors
+        keys = list(candidates)
+        padded = np.zeros((len(keys), CHUNK_SIZE + 2, CHUNK_SIZE + 2), dtype=np.uint8)
+        for i, (cx, cy) in enumerate(keys):
+            for dy, rows, source_rows in ((-1, slice(0, 1), slice(-1, None)),
+                                          (0, slice(1, -1), slice(None)),
+                                          (1, slice(-1, None), slice(0, 1))):
+                for dx, cols, source_cols in ((-1, slice(0, 1), slice(-1, None)),
+                                              (0, slice(1, -1), slice(None)),
+                                              (1, slice(-1, None), slice(0, 1))):
+                    neighbor = chunks.get((cx + dx, cy + dy))
+                    if neighbor is not None:
+                        padded[i, rows, cols] = neighbor[source_rows, source_cols]
+
+        columns = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+        core = padded[:, 1:-1, 1:-1]
+        neighbors = columns[:, :, :-2] + columns[:, :, 1:-1] + columns[:, :, 2:] - core
+        stepped = self.rule_table[core, neighbors]
+
+        # Keep only chunks that still hold living cells
+        alive = stepped.any(axis=(1, 2))
+        return {keys[i]: stepped[i] for i in np.flatnonzero(alive)}
+
+    def _advance(self) -> None:
+        """Replace the chunks with the next generation."""
+        self.chunks = self.engines[self.engine]()
+
+    def fast_forward(self, k: int) -> None:
+        """
+        Advance the world by 2^k generations at once using HashLife.
+
+        Args:
+            k: Power-of-two exponent of the number of generations to skip
+        """
+        previous = self._current_state()
+
+        if self._hashlife is None or not np.array_equal(self._hashlife.rule_table, self.rule_table):
+            self._hashlife = HashLife(self.rule_table)
+
+        self._hashlife.set_blocks(self.chunks)
+        self._hashlife.step(k)
+
+        self.chunks = {}
+        for x, y, block in self._hashlife.get_blocks(CHUNK_SIZE.bit_length() - 1):
+            self.set_world_region(x, y, block)
+        self._update_change_indexes(previous)
+
+        self.generation += 1 << k
+        self.population_history.append(self.get_population())
+        if len(self.population_history) > 100:
+            self.population_history = self.population_history[-100:]
@@ -0,0 +1,18 @@
+"""
+Regression tests for LifeEnsemble.
+"""
+
+from ensemble import LifeEnsemble
+
+
+def test_run_zero_generations_returns_empty_histories():
+    """Running for zero generations gives empty per-board histories and leaves the boards untouched."""
+    ensemble = LifeEnsemble(3, 10, 10)
+    ensemble.add_pattern(1, [[1, 1, 1]], 4, 4)
+
+    population, births, deaths = ensemble.run(0)
+
+    for series in (population, births, deaths):
+        assert series.shape == (0, 3)
+    assert ensemble.generation == 0
+    assert ensemble.get_populations().tolist() == [0, 3, 0]
@@ -0,0 +1,100 @@
+"""
+Regression tests for GameOfLife stepping engines and cycle detection.
+"""
+
+import numpy as np
+import pytest
+from bitboard import BitboardGameOfLife
+from game_of_life import GameOfLife, RULE_PRESETS
+
+# Every stepping backend checked against the per-cell reference engine
+ENGINE_FACTORIES = {
+    'numpy': lambda width, height, rule_set: GameOfLife(width, height, rule_set, engine='numpy'),
+    'tiled': lambda width, height, rule_set: GameOfLife(width, height, rule_set, engine='tiled', tile_size=4),
+    'parallel': lambda width, height, rule_set: GameOfLife(width, height, rule_set, engine='parallel', workers=3),
+    'bitboard': lambda width, height, rule_set: BitboardGameOfLife(width, height, rule_set)
+}
+
+
+@pytest.mark.parametrize('engine', list(ENGINE_FACTORIES))
+@pytest.mark.parametrize('rule_set', list(RULE_PRESETS), ids=lambda rule_set: rule_set.value)
+@pytest.mark.parametrize('width, height', [(13, 7), (67, 9)])
+def test_engine_matches_reference(engine, rule_set, width, height):
+    """Each engine steps a random odd-sized board exactly like the reference engine."""
+    start = np.random.default_rng(width * height).random((height, width)) < 0.35
+    game = ENGINE_FACTORIES[engine](width, height, rule_set)
+    reference = GameOfLife(width, height, rule_set, engine='reference')
+    game.grid = start.copy()
+    reference.grid = start.copy()
+
+    try:
+        for _ in range(6):
+            game.next_generation()
+            reference.next_generation()
+            assert np.array_equal(game.grid, reference.grid)
+            assert game.get_population() == reference.get_population()
+    finally:
+        game.shutdown_workers()
+
+
+def _locked_blinker() -> GameOfLife:
+    """Get a game whose blinker has been detected as a cycle and is being replayed."""
+    game = GameOfLife(20, 20)
+    game.add_pattern([[1, 1, 1]], 5, 5)
+    for _ in range(10):
+        game.next_generation()
+    assert game.get_cycle() == (0, 2)
+    return game
+
+
+def test_grid_assignment_ends_cycle_replay():
+    """A grid assigned during replay is stepped, not replaced by the stored cycle."""
+    game = _locked_blinker()
+    block = np.zeros((20, 20), dtype=bool)
+    block[10:12, 10:12] = True
+
+    game.grid = block
+    game.next_generation()
+
+    assert game.get_cycle() is None
+    assert sorted(game.get_living_cells()) == [(10, 10), (10, 11), (11, 10), (11, 11)]
+
+
+def test_in_place_edit_ends_cycle_replay():
+    """A grid edited in place during replay is stepped, not replaced by the stored cycle."""
+    game = _locked_blinker()
+    game.grid[10:12, 10:12] = True
+
+    game.next_generation()
+
+    assert game.get_cycle() is None
+    assert game.get_population() == 7
+    assert game.grid[10:12, 10:12].all()
+
+
+def test_living_cells_are_not_shared():
+    """Modifying the returned living cells doesn't corrupt later results."""
+    game = GameOfLife(10, 10)
+    game.add_pattern([[1, 1, 1]], 3, 3)
+
+    cells = game.get_living_cells()
+    cells.clear()
+
+    assert game.get_living_cells() == [(3, 3), (4, 3), (5, 3)]
+    with pytest.raises(ValueError):
+        game.get_living_coords()[0, 0] = 9
+
+
+def test_leaving_parallel_engine_stops_workers():
+    """Switching away from the parallel engine stops its workers and keeps the board."""
+    game = GameOfLife(12, 12, engine='parallel', workers=2)
+    game.add_pattern([[1, 1, 1]], 4, 4)
+    game.next_generation()
+    processes = list(game._parallel._processes)
+
+    game.set_engine('numpy')
+    game.next_generation()
+
+    assert game._parallel is None
+    assert not any(process.is_alive() for process in processes)
+    assert sorted(game.get_living_cells()) == [(4, 4), (5, 4), (6, 4)]
@@ -0,0 +1,27 @@
+"""
+Smoke tests for offline rendering.
+"""
+
+import wave
+import pytest
+from music_generator import MusicGenerator
+from game_of_life import GameOfLife
+from render import render_session
+
+MODES = list(MusicGenerator(GameOfLife(4, 4), headless=True).modes)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_render_every_mode(tmp_path, mode):
+    """Every mode accepted by the CLI renders audio, MIDI and an event log."""
+    wav_path = tmp_path / "session.wav"
+    duration = render_session(str(wav_path), pattern='pulsar', mode=mode, generations=8,
+                              tempo=600.0, width=30, height=20,
+                              midi_path=str(tmp_path / "session.mid"),
+                              event_log_path=str(tmp_path / "session.gole"))
+
+    assert duration >= 8 * 60.0 / 600.0
+    with wave.open(str(wav_path), 'rb') as wav:
+        assert wav.getnframes() == round(duration * wav.getframerate())
+    assert (tmp_path / "session.mid").read_bytes().startswith(b'MThd')
+    assert (tmp_path / "session.gole").read_bytes().startswith(b'GOLE')
@@ -0,0 +1,47 @@
+"""
+Regression tests for the unbounded SparseWorld.
+"""
+
+import numpy as np
+import pytest
+from sparse_world import SparseWorld
+
+
+def test_fast_forward_blinker_across_origin():
+    """A blinker straddling x=0 keeps its period when fast-forwarded with HashLife."""
+    world = SparseWorld(60, 40)
+    world.set_viewport(-30, -20)
+    world.add_pattern([[1, 1, 1]], 29, 20)  # World cells (-1, 0) to (1, 0)
+
+    world.fast_forward(1)
+    assert sorted(world.get_living_cells()) == [(29, 20), (30, 20), (31, 20)]
+
+    world.fast_forward(0)
+    assert sorted(world.get_living_cells()) == [(30, 19), (30, 20), (30, 21)]
+
+
+def test_fast_forward_matches_stepping_across_origin():
+    """Fast-forwarding a soup spanning all four quadrants matches stepping it."""
+    soup = (np.random.default_rng(0).random((30, 30)) < 0.4).astype(int).tolist()
+    worlds = []
+    for _ in range(2):
+        world = SparseWorld(60, 60)
+        world.set_viewport(-30, -30)
+        world.add_pattern(soup, 15, 15)  # World cells (-15, -15) to (14, 14)
+        worlds.append(world)
+
+    worlds[0].fast_forward(5)
+    for _ in range(32):
+        worlds[1].next_generation()
+
+    assert worlds[0].generation == worlds[1].generation
+    assert sorted(worlds[0].get_living_cells()) == sorted(worlds[1].get_living_cells())
+
+
+def test_rejected_b0_rule_keeps_current_rule():
+    """A B0 rule is refused without replacing the world's rule."""
+    world = SparseWorld(20, 20)
+    with pytest.raises(ValueError):
+        world.set_rule_set("B0/S8")
+    assert world.rulestring == "B3/S23"
+    assert not world.rule_table[0, 0]
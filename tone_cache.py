@@ -0,0 +1,80 @@
+"""
+Bounded LRU cache of synthesized tones for the music generator.
+Entries are evicted least-recently-used first once the total sample data
+exceeds a byte limit.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional
+
+import numpy as np
+
+
+class ToneCache:
+    """LRU cache of tone samples with a byte-size limit and hit/miss counters."""
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Maximum total size of cached sample data in bytes
+        """
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Get a cached tone, marking it most recently used, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, tone: np.ndarray, size: int) -> None:
+        """
+        Add a tone, evicting least recently used entries to stay within the byte limit.
+
+        Args:
+            key: Cache key
+            tone: Synthesized samples
+            size: Size of the tone's sample data in bytes
+        """
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self.total_bytes -= self._entries.pop(key)[1]
+
+        while self._entries and self.total_bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+        self._entries[key] = (tone, size)
+        self.total_bytes += size
+
+    def clear(self) -> None:
+        """Drop every cached tone (counters are kept)."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss counters."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
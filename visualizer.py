@@ -6,15 +6,18 @@ Now with white highlighting for cells that are currently playing notes.
 
 import pygame
 import sys
-from typing import Tuple, Optional
+import numpy as np
+from typing import List, Optional, Tuple
 from game_of_life import GameOfLife, RuleSet
+from sparse_world import SparseWorld
 from music_generator import MusicGenerator
+from audio_worker import AudioWorker
 
 
 class GameVisualizer:
     """Handles the visual display and user interaction for the Game of Life with note display and visual feedback."""
 
-    def __init__(self, width: int = 50, height: int = 50, cell_size: int = 20):
+    def __init__(self, width: int = 50, height: int = 50, cell_size: int = 20, unbounded: bool = False):
         """
         Initialize the visualizer.
 
@@ -22,6 +25,7 @@ class GameVisualizer:
             width: Grid width in cells
             height: Grid height in cells
             cell_size: Size of each cell in pixels
+            unbounded: Show a movable viewport on an unbounded world instead of a wrapping grid
         """
         self.cell_size = cell_size
         self.width = width
@@ -95,16 +99,34 @@ class GameVisualizer:
         self.font = pygame.font.Font(None, ui_font_size)
         self.small_font = pygame.font.Font(None, small_ui_font_size)
         self.note_font = pygame.font.Font(None, note_font_size)
+        self._note_labels = {}  # Rendered note names by (name, text color), for note_font
+
+        # Cells are drawn as one image: a pixel per cell, scaled up to the grid area.
+        # The palette maps cell states (dead, living, playing) to colors.
+        self._cell_palette = np.array([self.colors['dead_cell'], self.colors['living_cell'],
+                                       self.colors['playing_note']], dtype=np.uint8)
+        self._cell_image = np.zeros((width, height, 3), dtype=np.uint8)
+        self._cell_surface = pygame.Surface((width, height))
+        self._grid_surface = pygame.Surface((width * cell_size, height * cell_size))
+
+        # Only what changed since the last frame is redrawn: cell states and UI field
+        # text are compared with what is on screen, everything is drawn after a full redraw
+        self._full_redraw = True
+        self._cell_states: Optional[np.ndarray] = None
+        self._grid_key = None
+        self._ui_fields = {}
 
         # Game state
-        self.game = GameOfLife(width, height)
+        self.game = SparseWorld(width, height) if unbounded else GameOfLife(width, height)
         self.music_gen = MusicGenerator(self.game)
+        self.audio_worker = AudioWorker(self.music_gen)
         self.running = True
         self.paused = True
         self.show_grid = True
         self.show_notes = True  # Option to toggle note display
         self.music_enabled = True
         self.generation_speed = 20  # Frames per generation
+        self.music_gen.set_generation_speed(self.generation_speed)
 
         # Rule set management
         self.available_rule_sets = self.game.get_available_rule_sets()
@@ -128,7 +150,12 @@ class GameVisualizer:
 
         # Animation
         self.frame_counter = 0
-        self.cell_ages = {}  # Track how long cells have been alive
+        # Generations each cell has been alive, indexed as [y, x]: 0 for dead, newborn and
+        # placed cells, saturating at the uint16 maximum. Available to rendering and music.
+        self.cell_ages = np.zeros((height, width), dtype=np.uint16)
+
+        # Static part of the UI, drawn under the status fields on a full redraw
+        self._ui_panel_layer = self._build_ui_panel_layer()
 
     def handle_events(self) -> None:
         """Handle pygame events."""
@@ -136,6 +163,9 @@ class GameVisualizer:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True
+
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event)
 
@@ -152,7 +182,7 @@ class GameVisualizer:
 
         elif event.key == pygame.K_r:
             self.game.clear_grid()
-            self.cell_ages = {}
+            self.cell_ages.fill(0)
             self.paused = True
 
         elif event.key == pygame.K_m:
@@ -180,8 +210,10 @@ class GameVisualizer:
 
         elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
             self.generation_speed = max(1, self.generation_speed - 1)
+            self.music_gen.set_generation_speed(self.generation_speed)
         elif event.key == pygame.K_MINUS:
             self.generation_speed = min(20, self.generation_speed + 1)
+            self.music_gen.set_generation_speed(self.generation_speed)
 
         elif event.key == pygame.K_UP:
             self.music_gen.max_volume = min(1.0, self.music_gen.max_volume + 0.1)
@@ -218,6 +250,20 @@ class GameVisualizer:
         elif event.key == pygame.K_p:
             self._cycle_pattern()
 
+        # Viewport panning for unbounded worlds (I/J/K/L, C to center)
+        elif event.key == pygame.K_i:
+            self._pan_viewport(0, -self.height // 4)
+        elif event.key == pygame.K_k:
+            self._pan_viewport(0, self.height // 4)
+        elif event.key == pygame.K_j:
+            self._pan_viewport(-self.width // 4, 0)
+        elif event.key == pygame.K_l:
+            self._pan_viewport(self.width // 4, 0)
+        elif event.key == pygame.K_c:
+            if isinstance(self.game, SparseWorld):
+                self.game.center_viewport()
+                self.cell_ages.fill(0)
+
     def _handle_mouse_click(self, event: pygame.event.Event) -> None:
         """Handle mouse clicks."""
         if event.button == 1:  # Left click
@@ -227,9 +273,8 @@ class GameVisualizer:
                 grid_y = y // self.cell_size
                 self.game.toggle_cell(grid_x, grid_y)
 
-                # Track cell age for new cells
-                if self.game.get_cell(grid_x, grid_y):
-                    self.cell_ages[(grid_x, grid_y)] = 0
+                # New cells start at age 0, removed cells are dead
+                self.cell_ages[grid_y, grid_x] = 0
 
         elif event.button == 3:  # Right click - place pattern
             if self.selected_pattern:
@@ -247,96 +292,158 @@ class GameVisualizer:
                 grid_y = y // self.cell_size
                 if not self.game.get_cell(grid_x, grid_y):  # Only toggle if cell is dead
                     self.game.set_cell(grid_x, grid_y, True)
-                    self.cell_ages[(grid_x, grid_y)] = 0
+                    self.cell_ages[grid_y, grid_x] = 0
 
     def update(self) -> None:
         """Update the game state."""
         self.frame_counter += 1
 
-        # Update cell ages
-        for pos in list(self.cell_ages.keys()):
-            if self.game.get_cell(pos[0], pos[1]):
-                self.cell_ages[pos] += 1
-            else:
-                del self.cell_ages[pos]
-
         # Advance generation
         if not self.paused and self.frame_counter >= self.generation_speed:
             self.game.next_generation()
             self.frame_counter = 0
+            self._update_cell_ages()
 
-            # Generate music
+            # Generate music on the audio worker thread
             if self.music_enabled:
-                self.music_gen.generate_music()
+                self.audio_worker.submit(self.game)
+
+    def _update_cell_ages(self) -> None:
+        """Age surviving cells by one generation and reset dead and newborn cells to 0."""
+        grid = self.game.grid
+        ages = self.cell_ages
+        ages += grid & (ages < np.iinfo(ages.dtype).max)
+        ages *= grid & ~self.game.get_births()
 
     def draw(self) -> None:
-        """Draw the current state."""
-        self.screen.fill(self.colors['background'])
-
-        # Draw grid
-        if self.show_grid:
-            for x in range(0, self.screen_width, self.cell_size):
-                pygame.draw.line(self.screen, self.colors['grid_lines'], 
-                               (x, 0), (x, self.height * self.cell_size))
-            for y in range(0, self.height * self.cell_size, self.cell_size):
-                pygame.draw.line(self.screen, self.colors['grid_lines'], 
-                               (0, y), (self.screen_width, y))
-
-        # Draw cells
-        for y in range(self.height):
-            for x in range(self.width):
-                rect = pygame.Rect(x * self.cell_size, y * self.cell_size, 
-                                 self.cell_size, self.cell_size)
-
-                if self.game.get_cell(x, y):
-                    # Check if this cell is currently playing a note
-                    is_playing = self.music_gen.is_cell_playing_note(x, y) if self.music_enabled else False
-
-                    if is_playing:
-                        # WHITE for cells currently playing notes
-                        color = self.colors['playing_note']
-                        text_color = self.colors['playing_note_text']
-                    else:
-                        # Scale-based color for other living cells
-                        current_scale = self.music_gen.current_scale
-                        color = self.scale_colors.get(current_scale, self.colors['living_cell'])
-                        text_color = self.colors['note_text']
-
-                    pygame.draw.rect(self.screen, color, rect)
-
-                    # Draw inner rectangle for better visibility
-                    inner_rect = pygame.Rect(x * self.cell_size + 1, y * self.cell_size + 1,
-                                           self.cell_size - 2, self.cell_size - 2)
-                    pygame.draw.rect(self.screen, color, inner_rect)
-
-                    # Draw note name on top of the cell if enabled and available
-                    if self.show_notes and self.music_enabled:
-                        note_name = self.music_gen.get_cell_note(x, y)
-                        if note_name:
-                            self._draw_note_on_cell(x, y, note_name, text_color)
-
-                else:
-                    # Dead cell
-                    pygame.draw.rect(self.screen, self.colors['dead_cell'], rect)
-
-        # Draw UI
-        self._draw_ui()
-
-        pygame.display.flip()
-
-    def _draw_note_on_cell(self, x: int, y: int, note_name: str, text_color: Tuple[int, int, int]) -> None:
-        """Draw a note name on top of a cell with specified text color."""
-        # Create text surface
-        text_surface = self.note_font.render(note_name, True, text_color)
-        text_rect = text_surface.get_rect()
-
-        # Center the text in the cell
-        cell_center_x = x * self.cell_size + self.cell_size // 2
-        cell_center_y = y * self.cell_size + self.cell_size // 2
-        text_rect.center = (cell_center_x, cell_center_y)
-
-        # Draw the text
-        self.screen.blit(text_surface, text_rect)
+        """Redraw what changed since the last frame and push only those regions to the display."""
+        if self._full_redraw:
+            self.screen.fill(self.colors['background'])
+            self.screen.blit(self._ui_panel_layer, (0, self.height * self.cell_size + 10))
+            self._cell_states = None
+            self._ui_fields = {}
+
+        # Draw cells and UI fields that changed
+        dirty_rects = self._draw_cells()
+        dirty_rects += self._draw_ui()
+
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+
+    def _get_cell_states(self) -> np.ndarray:
+        """Get the state of every cell indexed as [y, x]: 0 dead, 1 living, 2 playing a note."""
+        states = self.game.grid.astype(np.uint8)
+        if self.music_enabled:
+            states += states & self.music_gen.get_playing_note_mask()
+        return states
+
+    def _draw_cells(self) -> List[pygame.Rect]:
+        """
+        Redraw the cells whose state changed since the last frame (or every cell after
+        a scale or note display change). Cells are colored as a pixel per cell with
+        array operations and the image is scaled up to the grid area in one operation.
+
+        Returns:
+            Screen regions that were redrawn
+        """
+        states = self._get_cell_states()
+        show_labels = self.show_notes and self.music_enabled
+        # Read the scale once: density mode changes it on the audio worker thread
+        scale = self.music_gen.current_scale
+        grid_key = (scale, show_labels)
+
+        if self._cell_states is None or grid_key != self._grid_key:
+            changed = np.ones(states.shape, dtype=bool)
+        else:
+            changed = states != self._cell_states
+            if not changed.any():
+                return []
+        self._cell_states = states
+        self._grid_key = grid_key
+
+        # WHITE for cells currently playing notes, scale-based color for other living cells
+        self._cell_palette[1] = self.scale_colors.get(scale, self.colors['living_cell'])
+
+        # Surface arrays are indexed as [x, y]
+        np.take(self._cell_palette, states.T, axis=0, out=self._cell_image)
+        pygame.surfarray.blit_array(self._cell_surface, self._cell_image)
+        pygame.transform.scale(self._cell_surface, self._grid_surface.get_size(), self._grid_surface)
+
+        rects = []
+        for x0, y0, x1, y1 in self._get_dirty_regions(changed):
+            rects.append(self._draw_cell_region(states, x0, y0, x1, y1))
+        return rects
+
+    @staticmethod
+    def _get_dirty_regions(changed: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """
+        Cover the changed cells with rectangles: the span of changes in each row,
+        merged with the rows below while the span stays the same.
+
+        Returns:
+            (x0, y0, x1, y1) cell ranges, end-exclusive
+        """
+        rows = np.flatnonzero(changed.any(axis=1))
+        first = changed[rows].argmax(axis=1)
+        last = changed.shape[1] - changed[rows, ::-1].argmax(axis=1)
+
+        regions = []
+        for y, x0, x1 in zip(rows.tolist(), first.tolist(), last.tolist()):
+            if regions and regions[-1][3] == y and regions[-1][0] == x0 and regions[-1][2] == x1:
+                regions[-1] = (x0, regions[-1][1], x1, y + 1)
+            else:
+                regions.append((x0, y, x1, y + 1))
+        return regions
+
+    def _draw_cell_region(self, states: np.ndarray, x0: int, y0: int, x1: int, y1: int) -> pygame.Rect:
+        """Draw the cells and note names of a range of cells and return its screen rect."""
+        size = self.cell_size
+        rect = pygame.Rect(x0 * size, y0 * size, (x1 - x0) * size, (y1 - y0) * size)
+        self.screen.set_clip(rect)
+        # Grid lines lie under the cells, which fill the whole grid area, so only the cells are drawn
+        self.screen.blit(self._grid_surface, rect, rect)
+
+        # Draw note names on top of living cells if enabled
+        if self.show_notes and self.music_enabled:
+            # Note of every cell, looked up from the precomputed maps
+            scale = self._grid_key[0]
+            note_names = self.music_gen.get_note_names(scale)
+            note_index = self.music_gen.get_note_index_map(scale)
+
+            # Black text for notes on colored cells and on white cells, by cell state
+            text_colors = (None, self.colors['note_text'], self.colors['playing_note_text'])
+
+            ys, xs = np.nonzero(states[y0:y1, x0:x1])
+            ys += y0
+            xs += x0
+            labels = []
+            for x, y, state, index in zip(xs.tolist(), ys.tolist(), states[ys, xs].tolist(),
+                                          note_index[ys, xs].tolist()):
+                # Center the text in the cell
+                surface, (dx, dy) = self._get_note_label(note_names[index], text_colors[state])
+                labels.append((surface, (x * size + size // 2 - dx, y * size + size // 2 - dy)))
+            self.screen.blits(labels, doreturn=False)
+
+        self.screen.set_clip(None)
+        return rect
+
+    def _get_note_label(self, note_name: str, text_color: Tuple[int, int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Get a note name rendered in a text color, rendering it on first use only.
+
+        Returns:
+            Text surface and the offset from its top left corner to its center
+        """
+        key = (note_name, text_color)
+        label = self._note_labels.get(key)
+        if label is None:
+            surface = self.note_font.render(note_name, True, text_color)
+            label = (surface, (surface.get_width() // 2, surface.get_height() // 2))
+            self._note_labels[key] = label
+        return label
 
     def _switch_rule_set(self, rule_index: int) -> None:
         """Switch to a specific rule set by index."""
@@ -360,6 +467,12 @@ class GameVisualizer:
         self.music_gen.set_scale(scale)
         print(f"Switched to scale: {scale}")
 
+    def _pan_viewport(self, dx: int, dy: int) -> None:
+        """Move the viewport of an unbounded world."""
+        if isinstance(self.game, SparseWorld):
+            self.game.move_viewport(dx, dy)
+            self.cell_ages.fill(0)
+
     def _cycle_pattern(self) -> None:
         """Cycle through available patterns."""
         pattern_names = list(self.patterns.keys())
@@ -374,40 +487,22 @@ class GameVisualizer:
 
         print(f"Selected pattern: {self.selected_pattern}")
 
-    def _draw_ui(self) -> None:
-        """Draw the user interface."""
+    def _build_ui_panel_layer(self) -> pygame.Surface:
+        """Draw the parts of the user interface that never change once: the panel and the controls."""
         ui_y = self.height * self.cell_size + 10  # Increased margin
 
         # Background for UI
-        ui_rect = pygame.Rect(0, ui_y, self.screen_width, self.screen_height - ui_y)
-        pygame.draw.rect(self.screen, self.colors['ui_bg'], ui_rect)
-        pygame.draw.line(self.screen, self.colors['ui_border'], 
-                        (0, ui_y), (self.screen_width, ui_y))
-
-        # Status information
-        current_rule = self.available_rule_sets[self.current_rule_index]
-        status_text = [
-            f"Generation: {self.game.generation}",
-            f"Population: {len(self.game.get_living_cells())}",
-            f"Density: {self.game.get_cell_density():.3f}",
-            f"Rule Set: {current_rule.value}",
-            f"Speed: {self.generation_speed}",
-            f"Volume: {self.music_gen.max_volume:.1f}",
-            f"Sustain: {self.music_gen.sustain_duration:.1f}s"
-        ]
+        panel = pygame.Surface((self.screen_width, self.screen_height - ui_y))
+        panel.fill(self.colors['ui_bg'])
+        pygame.draw.line(panel, self.colors['ui_border'], (0, 0), (self.screen_width, 0))
 
-        x_offset = 15  # Increased margin
+        # Controls - adjusted spacing for larger fonts, below the status information
         line_height = max(18, self.cell_size)  # Scale line height with cell size
-        for i, text in enumerate(status_text):
-            surface = self.small_font.render(text, True, self.colors['text'])
-            self.screen.blit(surface, (x_offset, ui_y + 10 + i * line_height))
-
-        # Controls - adjusted spacing for larger fonts
-        controls_y = ui_y + 10 + len(status_text) * line_height + 15
+        controls_y = 10 + len(self._get_status_text()) * line_height + 15
         controls_text = [
             "SPACE: Pause/Play | R: Reset | M: Music On/Off | N: Notes On/Off",
             "S: Cycle Scales | Q/W/E/T: Mode (Position/Density/Pattern/Harmonic)",
-            "F1-F8: Rule Sets | TAB: Cycle Rules | P: Cycle Patterns",
+            "F1-F8: Rule Sets | TAB: Cycle Rules | P: Cycle Patterns | I/J/K/L/C: Pan/Center View",
             "G: Grid | +/-: Speed | Up/Down: Volume | Left/Right: Sustain",
             "Left Click: Toggle Cell | Right Click: Place Pattern | WHITE CELLS = Playing Notes"
         ]
@@ -415,23 +510,68 @@ class GameVisualizer:
         control_line_height = max(16, self.cell_size - 2)  # Slightly smaller for controls
         for i, text in enumerate(controls_text):
             surface = self.small_font.render(text, True, self.colors['text'])
-            self.screen.blit(surface, (15, controls_y + i * control_line_height))
+            panel.blit(surface, (15, controls_y + i * control_line_height))
+        return panel
 
-        # Current settings - positioned on the right
-        settings_text = [
+    def _get_status_text(self) -> List[str]:
+        """Get the lines of status information."""
+        current_rule = self.available_rule_sets[self.current_rule_index]
+        return [
+            f"Generation: {self.game.generation}",
+            f"Population: {self.game.get_population()}",
+            f"Density: {self.game.get_cell_density():.3f}",
+            f"Rule Set: {current_rule.value}",
+            f"Speed: {self.generation_speed}",
+            f"Volume: {self.music_gen.max_volume:.1f}",
+            f"Sustain: {self.music_gen.sustain_duration:.1f}s"
+        ]
+
+    def _get_settings_text(self) -> List[str]:
+        """Get the lines of current settings."""
+        # Generations the audio worker failed to play, with the type of the last error
+        errors = self.audio_worker.errors
+        audio_errors = f" ({errors} errors: {type(self.audio_worker.last_error).__name__})" if errors else ""
+        return [
             f"Scale: {self.music_gen.current_scale}",
             f"Mode: {self.music_gen.current_mode}",
-            f"Music: {'ON' if self.music_enabled else 'OFF'}",
+            f"Music: {'ON' if self.music_enabled else 'OFF'}{audio_errors}",
             f"Notes: {'ON' if self.show_notes else 'OFF'}",
             f"Sustain: {self.music_gen.sustain_duration:.1f}s",
             f"Pattern: {self.selected_pattern if self.selected_pattern else 'None'}",
             f"Status: {'PAUSED' if self.paused else 'RUNNING'}"
         ]
 
-        settings_x = max(self.screen_width - 250, self.screen_width * 0.7)  # Adaptive positioning
-        for i, text in enumerate(settings_text):
-            surface = self.small_font.render(text, True, self.colors['text'])
-            self.screen.blit(surface, (int(settings_x), ui_y + 10 + i * line_height))
+    def _draw_ui(self) -> List[pygame.Rect]:
+        """
+        Redraw the status and settings fields whose text changed since the last frame.
+
+        Returns:
+            Screen regions that were redrawn
+        """
+        ui_y = self.height * self.cell_size + 10  # Increased margin
+        line_height = max(18, self.cell_size)  # Scale line height with cell size
+
+        # Status information on the left, current settings - positioned on the right
+        x_offset = 15  # Increased margin
+        settings_x = int(max(self.screen_width - 250, self.screen_width * 0.7))  # Adaptive positioning
+        columns = [
+            (x_offset, settings_x - x_offset, self._get_status_text()),
+            (settings_x, self.screen_width - settings_x, self._get_settings_text())
+        ]
+
+        rects = []
+        for x, width, lines in columns:
+            for i, text in enumerate(lines):
+                if self._ui_fields.get((x, i)) == text:
+                    continue
+                self._ui_fields[(x, i)] = text
+
+                rect = pygame.Rect(x, ui_y + 10 + i * line_height, width, line_height)
+                self.screen.fill(self.colors['ui_bg'], rect)
+                surface = self.small_font.render(text, True, self.colors['text'])
+                self.screen.blit(surface, rect.topleft)
+                rects.append(rect)
+        return rects
 
     def run(self) -> None:
         """Main game loop."""
@@ -445,6 +585,7 @@ class GameVisualizer:
 
     def cleanup(self) -> None:
         """Clean up resources."""
+        self.audio_worker.stop()
         self.music_gen.cleanup()
         pygame.quit()
         sys.exit()
@@ -0,0 +1,206 @@
+"""
+Streaming software mixer for the music generator.
+Sums a fixed pool of voices into short output blocks that are queued on a
+single pygame channel, stealing the oldest or quietest voice when every
+voice is busy. Voices can start at any sample of the mixer's sample clock.
+Memory use is constant once the pool and blocks exist.
+"""
+
+import numpy as np
+import pygame
+from typing import Dict, Optional
+
+
+class VoiceMixer:
+    """Fixed pool of voices mixed in software and streamed through one pygame channel."""
+
+    STEAL_POLICIES = ('oldest', 'quietest')
+
+    def __init__(self, voices: int = 32, block_frames: int = 1024, steal_policy: str = 'oldest',
+                 stream: bool = True):
+        """
+        Initialize the voice pool and, when streaming, reserve a pygame channel for output.
+        Streaming requires the pygame mixer to be initialized already.
+
+        Args:
+            voices: Maximum number of notes sounding at once
+            block_frames: Frames mixed per output block (latency is up to two blocks)
+            steal_policy: Voice to replace when all are busy, 'oldest' or 'quietest'
+            stream: Play through pygame; if False, blocks are only produced by mix_block()
+        """
+        if steal_policy not in self.STEAL_POLICIES:
+            raise ValueError(f"Unknown steal policy '{steal_policy}', expected one of {self.STEAL_POLICIES}")
+
+        self.voices = voices
+        self.block_frames = block_frames
+        self.steal_policy = steal_policy
+        self.stream = stream
+
+        # Voice state: the tone each voice plays, when it starts and how far it has got
+        self._tones = [None] * voices
+        self._start_times = np.zeros(voices, dtype=np.int64)
+        self._positions = np.zeros(voices, dtype=np.int64)
+        self._levels = np.zeros(voices)
+        self._started = np.zeros(voices, dtype=np.int64)
+        self._active = np.zeros(voices, dtype=bool)
+        self._note_counter = 0
+
+        self.notes_played = 0
+        self.notes_stolen = 0
+        self.underruns = 0
+        self._streaming = False
+
+        # Number of frames mixed so far; notes are scheduled on this clock
+        self.sample_clock = 0
+
+        self._mix_buffer = np.zeros(block_frames, dtype=np.int32)
+        if stream:
+            self._allocate_output()
+
+    def _allocate_output(self) -> None:
+        """Reserve the output channel and create the ring of output blocks for the current mixer settings."""
+        self.mixer_settings = pygame.mixer.get_init()
+        pygame.mixer.set_reserved(1)
+        self.channel = pygame.mixer.Channel(0)
+
+        # Three blocks: one playing, one queued and one being mixed
+        channels = self.mixer_settings[2]
+        silence = np.zeros((self.block_frames, channels) if channels > 1 else self.block_frames, dtype=np.int16)
+        self._blocks = [pygame.mixer.Sound(silence) for _ in range(3)]
+        self._block_samples = [pygame.sndarray.samples(block) for block in self._blocks]
+        self._next_block = 0
+
+    def play(self, tone: np.ndarray, level: float = 1.0, start: Optional[int] = None) -> int:
+        """
+        Start a note on a free voice, stealing one if the pool is full.
+
+        Args:
+            tone: Mono 16-bit samples of the note
+            level: Loudness of the note, used by the 'quietest' steal policy
+            start: Sample clock time to start at (default: the next mixed frame);
+                   times already mixed start at the next mixed frame
+
+        Returns:
+            Index of the voice playing the note
+        """
+        free = np.flatnonzero(~self._active)
+        if len(free) > 0:
+            voice = int(free[0])
+        else:
+            voice = self._steal_voice()
+            self.notes_stolen += 1
+
+        self._tones[voice] = tone
+        self._start_times[voice] = self.sample_clock if start is None else max(start, self.sample_clock)
+        self._positions[voice] = 0
+        self._levels[voice] = level
+        self._started[voice] = self._note_counter
+        self._active[voice] = True
+        self._note_counter += 1
+        self.notes_played += 1
+        return voice
+
+    def _steal_voice(self) -> int:
+        """Choose the busy voice to replace according to the steal policy."""
+        if self.steal_policy == 'quietest':
+            # Quietest first, oldest among equally quiet voices
+            return int(np.lexsort((self._started, self._levels))[0])
+        return int(np.argmin(self._started))
+
+    def mix_block(self, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Mix the next block of every active voice and advance them.
+
+        Args:
+            frames: Number of frames to mix, at most block_frames (default: block_frames)
+
+        Returns:
+            Mono 32-bit mix of the requested frames (reused between calls)
+        """
+        mix = self._mix_buffer[:self.block_frames if frames is None else frames]
+        mix.fill(0)
+        block_start = self.sample_clock
+
+        for voice in np.flatnonzero(self._active):
+            # Voices scheduled inside this block start part-way through it
+            offset = max(0, self._start_times[voice] - block_start)
+            if offset >= len(mix):
+                continue
+
+            tone = self._tones[voice]
+            start = self._positions[voice]
+            frames = min(len(mix) - offset, len(tone) - start)
+            mix[offset:offset + frames] += tone[start:start + frames]
+
+            if start + frames >= len(tone):
+                self._tones[voice] = None
+                self._active[voice] = False
+            else:
+                self._positions[voice] = start + frames
+
+        self.sample_clock += len(mix)
+        return mix
+
+    def update(self, start: bool = False) -> None:
+        """
+        Keep the output channel fed; call at least once per block duration.
+        Once the first note plays (or start is set), blocks - silent if need be - are
+        streamed continuously, so the sample clock keeps pace with playback.
+        """
+        if not self.stream:
+            return
+
+        if pygame.mixer.get_init() != self.mixer_settings:
+            self._allocate_output()
+
+        if not self.channel.get_busy():
+            # Ran dry while streaming
+            if self._streaming:
+                self.underruns += 1
+            elif not (start or self._active.any()):
+                return
+            self.channel.play(self._render_next_block())
+            self._streaming = True
+
+        if self.channel.get_queue() is None:
+            self.channel.queue(self._render_next_block())
+
+    def _render_next_block(self) -> pygame.mixer.Sound:
+        """Mix into the next free output block and return it."""
+        block = self._blocks[self._next_block]
+        samples = self._block_samples[self._next_block]
+        self._next_block = (self._next_block + 1) % len(self._blocks)
+
+        mix = self.mix_block()
+        mixed = np.clip(mix, -32768, 32767, out=mix)
+        if samples.ndim > 1:
+            samples[:] = mixed[:, None]
+        else:
+            samples[:] = mixed
+        return block
+
+    def is_streaming(self) -> bool:
+        """Check whether blocks are being streamed to the output channel."""
+        return self._streaming
+
+    def stop_all(self) -> None:
+        """Silence every voice and the output channel."""
+        self._tones = [None] * self.voices
+        self._active.fill(False)
+        self._streaming = False
+        if self.stream:
+            self.channel.stop()
+
+    def get_active_voice_count(self) -> int:
+        """Get the number of voices currently playing a note."""
+        return int(self._active.sum())
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get voice usage counters."""
+        return {
+            'voices': self.voices,
+            'active': self.get_active_voice_count(),
+            'played': self.notes_played,
+            'stolen': self.notes_stolen,
+            'underruns': self.underruns
+        }